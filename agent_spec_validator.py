@@ -4,94 +4,111 @@ import sys
 import os
 import re
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+_SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+$')
+_SECRET_NAME_RE = re.compile(r'^[A-Z0-9_]+$')
+_AGENT_TYPES = frozenset({'chatbot', 'parser', 'telecaller', 'recommender', 'other'})
+
+# Top-level spec fields: (name, required, valid_values, regex)
+_TOP_LEVEL_FIELDS = (
+    ('agent_name', True, None, None),
+    ('version', True, None, _SEMVER_RE),  # SemVer
+    ('owner', True, None, None),
+    ('agent_type', True, _AGENT_TYPES, None),
+    ('commit_hash', False, None, None),  # Should be injected during build really, but good to have constraint if present
+)
+
 def load_spec(file_path):
     try:
-        with open(file_path, 'r') as f:
-            return yaml.safe_load(f)
+        with open(file_path, 'rb') as f:
+            return yaml.load(f, Loader=_Loader)
     except Exception as e:
         print(f"❌ Error loading YAML: {e}")
         sys.exit(1)
 
 def check_field(data, field, required=True, valid_values=None, regex=None):
+    """Return (ok, error_message) — error_message is None when the field passes."""
     if field not in data:
         if required:
-            print(f"❌ Missing required field: {field}")
-            return False
-        return True
+            return False, f"❌ Missing required field: {field}"
+        return True, None
     
     value = data[field]
     
-    if valid_values and value not in valid_values:
-        print(f"❌ Invalid value for {field}: {value}. Expected one of {valid_values}")
-        return False
+    try:
+        allowed = not valid_values or value in valid_values
+    except TypeError:  # unhashable value (list/dict) can't be a member of a frozenset
+        allowed = False
+    if not allowed:
+        return False, f"❌ Invalid value for {field}: {value}. Expected one of {sorted(valid_values)}"
         
-    if regex and not re.match(regex, str(value)):
-        print(f"❌ Invalid format for {field}: {value}. Expected usage of regex {regex}")
-        return False
+    if regex and not regex.match(str(value)):
+        return False, f"❌ Invalid format for {field}: {value}. Expected usage of regex {regex.pattern}"
         
-    return True
+    return True, None
 
 def validate_secrets(spec):
     # Ensure no secrets are hardcoded in the spec
     secrets = spec.get('secrets', [])
     for secret in secrets:
-        if not re.match(r'^[A-Z0-9_]+$', secret):
-            print(f"❌ Invalid secret name format: {secret}. Should be uppercase ENV var style.")
-            return False
-    
-    # Check if any sensitive keys are accidentally in other fields
-    spec_str = str(spec).lower()
-    suspicious_patterns = ['api_key', 'password', 'secret', 'token']
+        if not _SECRET_NAME_RE.match(secret):
+            return False, f"❌ Invalid secret name format: {secret}. Should be uppercase ENV var style."
     
-    # Allow 'secrets' field to mention them, but look for values looking like real keys in other places
-    # This is a bit advanced, for now a simple check:
-    # If the user put a real key in "description" or something, catch it?
-    # Maybe simply warn if values define look like high entropy strings? 
-    # For now, just ensuring 'secrets' list assumes ENV injection is enough for structure.
-    return True
+    # Scanning other fields for values that look like real keys (high entropy
+    # strings etc.) is a possible future check. For now, ensuring the 'secrets'
+    # list assumes ENV injection is enough for structure.
+    return True, None
 
-def validate_agent_spec(file_path):
-    print(f"🔍 Validating {file_path}...")
-    spec = load_spec(file_path)
-    valid = True
+def collect_spec_errors(spec):
+    """Run every check against a parsed spec. Returns (errors, warnings) without printing."""
+    errors = []
+    warnings = []
+
+    def _record(result):
+        ok, message = result
+        if not ok:
+            errors.append(message)
+
+    # 1. Core Metadata + 2. Spec Improvements
+    for spec_check in _TOP_LEVEL_FIELDS:
+        _record(check_field(spec, *spec_check))
 
-    # 1. Core Metadata
-    valid &= check_field(spec, 'agent_name')
-    valid &= check_field(spec, 'version', regex=r'^\d+\.\d+\.\d+$') # SemVer
-    valid &= check_field(spec, 'owner')
-    valid &= check_field(spec, 'agent_type', valid_values=['chatbot', 'parser', 'telecaller', 'recommender', 'other'])
-    
-    # 2. Spec Improvements
-    valid &= check_field(spec, 'commit_hash', required=False) # Should be injected during build really, but good to have constraint if present
-    
     # 3. LLM Provider
     if 'llm_provider' in spec:
-        valid &= check_field(spec['llm_provider'], 'name')
-        valid &= check_field(spec['llm_provider'], 'model')
+        _record(check_field(spec['llm_provider'], 'name'))
+        _record(check_field(spec['llm_provider'], 'model'))
     else:
-        print("❌ Missing llm_provider section")
-        valid = False
+        errors.append("❌ Missing llm_provider section")
 
     # 4. Secrets
     if 'secrets' not in spec:
-        print("⚠️  No 'secrets' section found. If this agent uses APIs, declare required ENV vars here.")
+        warnings.append("⚠️  No 'secrets' section found. If this agent uses APIs, declare required ENV vars here.")
     else:
-        valid &= validate_secrets(spec)
+        _record(validate_secrets(spec))
 
     # 5. Guardrails
     if 'guardrails' not in spec:
-        print("❌ Missing guardrails section")
-        valid = False
+        errors.append("❌ Missing guardrails section")
     else:
-        valid &= check_field(spec['guardrails'], 'pii_filter', required=True)
-        valid &= check_field(spec['guardrails'], 'prompt_versioning', valid_values=[True])
+        _record(check_field(spec['guardrails'], 'pii_filter', required=True))
+        _record(check_field(spec['guardrails'], 'prompt_versioning', valid_values=frozenset({True})))
 
-    if valid:
-        print("✅ Spec is VALID!")
-        return True
-    else:
-        print("❌ Spec validation FAILED.")
-        return False
+    return errors, warnings
+
+def validate_agent_spec(file_path):
+    print(f"🔍 Validating {file_path}...")
+    spec = load_spec(file_path)
+    errors, warnings = collect_spec_errors(spec)
+
+    # Emit the whole report in one write instead of a print per finding
+    lines = warnings + errors
+    lines.append("❌ Spec validation FAILED." if errors else "✅ Spec is VALID!")
+    sys.stdout.write("\n".join(lines) + "\n")
+    return not errors
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
@@ -12,18 +12,30 @@ Usage:
 
     # Legacy: Use custom LLM orchestration
     from agno_single_agent_framework import BaseAgent
+
+Public names resolve lazily (PEP 562): importing the package doesn't load
+Agno, provider SDKs or the web stack until a name is first used.
 """
 
-from agno_single_agent_framework.core.base_agent import BaseAgent  # Legacy
-from agno_single_agent_framework.core.agno_base_agent import AgnoBaseAgent  # Recommended
-from agno_single_agent_framework.core.skill_loader import SkillLoader, Skill
-from agno_single_agent_framework.providers.llm_client import LLMClient, create_provider
-from agno_single_agent_framework.providers.base_provider import LLMResponse
-from agno_single_agent_framework.core.tool_router import ToolRouter
-from agno_single_agent_framework.services.guardrails import Guardrails
-from agno_single_agent_framework.services.observability import StructuredLogger, new_trace
-from agno_single_agent_framework.services.logging import setup_logging, get_logger, LogContext
-from agno_single_agent_framework.core.memory import MemoryManager
+from agno_single_agent_framework._lazy import make_getattr
+
+_LAZY = {
+    "BaseAgent":        "agno_single_agent_framework.core.base_agent",       # Legacy
+    "AgnoBaseAgent":    "agno_single_agent_framework.core.agno_base_agent",  # Recommended
+    "SkillLoader":      "agno_single_agent_framework.core.skill_loader",
+    "Skill":            "agno_single_agent_framework.core.skill_loader",
+    "ToolRouter":       "agno_single_agent_framework.core.tool_router",
+    "MemoryManager":    "agno_single_agent_framework.core.memory",
+    "LLMClient":        "agno_single_agent_framework.providers.llm_client",
+    "create_provider":  "agno_single_agent_framework.providers.llm_client",
+    "LLMResponse":      "agno_single_agent_framework.providers.base_provider",
+    "Guardrails":       "agno_single_agent_framework.services.guardrails",
+    "StructuredLogger": "agno_single_agent_framework.services.observability",
+    "new_trace":        "agno_single_agent_framework.services.observability",
+    "setup_logging":    "agno_single_agent_framework.services.logging",
+    "get_logger":       "agno_single_agent_framework.services.logging",
+    "LogContext":       "agno_single_agent_framework.services.logging",
+}
 
 __version__ = "1.0.0-agno"
 
@@ -44,3 +56,5 @@ __all__ = [
     "LogContext",
     "new_trace",
 ]
+
+__getattr__ = make_getattr(_LAZY, __name__)
@@ -0,0 +1,24 @@
+"""
+PEP 562 lazy exports shared by the package ``__init__`` modules.
+"""
+
+import importlib
+import sys
+
+
+def make_getattr(lazy: dict, module_name: str):
+    """
+    Build a module ``__getattr__`` resolving names from ``lazy`` (name → module path).
+
+    The resolved value is stored in the package namespace, so each name is
+    imported once and later lookups skip ``__getattr__`` entirely.
+    """
+    def __getattr__(name):
+        module_path = lazy.get(name)
+        if module_path is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_path), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
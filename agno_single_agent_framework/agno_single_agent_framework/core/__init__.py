@@ -1,6 +1,19 @@
-from agno_single_agent_framework.core.base_agent import BaseAgent
-from agno_single_agent_framework.core.tool_router import ToolRouter
-from agno_single_agent_framework.core.memory import MemoryManager, RedisMemoryManager
-from agno_single_agent_framework.core.skill_loader import SkillLoader, Skill
+"""
+Core agent components — public names resolve lazily (PEP 562), so importing
+one (e.g. MemoryManager) doesn't load the agent and provider stack.
+"""
+
+from agno_single_agent_framework._lazy import make_getattr
+
+_LAZY = {
+    "BaseAgent":          "agno_single_agent_framework.core.base_agent",
+    "ToolRouter":         "agno_single_agent_framework.core.tool_router",
+    "MemoryManager":      "agno_single_agent_framework.core.memory",
+    "RedisMemoryManager": "agno_single_agent_framework.core.memory",
+    "SkillLoader":        "agno_single_agent_framework.core.skill_loader",
+    "Skill":              "agno_single_agent_framework.core.skill_loader",
+}
 
 __all__ = ["BaseAgent", "ToolRouter", "MemoryManager", "RedisMemoryManager", "SkillLoader", "Skill"]
+
+__getattr__ = make_getattr(_LAZY, __name__)
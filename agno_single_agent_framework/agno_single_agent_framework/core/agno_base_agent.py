@@ -9,15 +9,22 @@ guardrails and observability features.
 import os
 import time
 import logging
+import functools
+import importlib
+import weakref
 from abc import ABC
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 # Agno imports
 from agno.agent import Agent
-from agno.models.openai import OpenAI
-from agno.models.anthropic import Claude
-from agno.models.google import Gemini
-from agno.db.sqlite import SqliteDb
+
+import yaml
+
+# libyaml-backed loader when available — much faster than the pure-Python SafeLoader
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 # Agno exceptions (guardrails raise these automatically via pre/post hooks)
 try:
@@ -32,17 +39,76 @@ from agno_single_agent_framework.services.guardrails import build_guardrail_hook
 from agno_single_agent_framework.services.observability import new_trace, log_run_metrics
 from agno_single_agent_framework.services.logging import setup_logging, set_request_context, clear_request_context, get_logger
 
-# Custom Toolkit imports
-from agno_single_agent_framework.tools.calculator import CalculatorToolkit
-from agno_single_agent_framework.tools.web_search import WebSearchToolkit
-from agno_single_agent_framework.tools.http_request import HTTPRequestToolkit
-from agno_single_agent_framework.tools.email_sender import EmailSenderToolkit
-from agno_single_agent_framework.tools.file_parser import FileParserToolkit
-from agno_single_agent_framework.tools.database_lookup import DatabaseLookupToolkit
+# Custom toolkits are imported on demand via _CUSTOM_TOOLKIT_REGISTRY
 from agno_single_agent_framework.tools.agno_builtin import AGNO_BUILTIN_REGISTRY, load_agno_toolkit
 
 logger = logging.getLogger(__name__)
 
+# Provider name → (Agno model module, model class). Modules are imported on
+# first use so only the provider SDK an agent actually needs gets loaded.
+# A single dict probe replaces the old if/elif chain (and keeps 3.9 support,
+# which rules out `match`).
+_PROVIDER_REGISTRY: Dict[str, Tuple[str, str]] = {
+    "openai":    ("agno.models.openai",    "OpenAI"),
+    "anthropic": ("agno.models.anthropic", "Claude"),
+    "gemini":    ("agno.models.google",    "Gemini"),
+}
+
+# Immutable, so one instance can be shared by every response without tool calls
+_EMPTY_TOOL_CALLS = ()
+
+_PROMPT_PATHS = ("prompts/system_prompt.txt", "app/prompts/system_prompt.txt")
+_DEFAULT_SYSTEM_PROMPT = "You are a helpful AI assistant."
+
+
+@functools.lru_cache(maxsize=32)
+def _read_prompt(paths: Tuple[str, ...]) -> Tuple[Optional[str], str]:
+    """Return (path, prompt) for the first existing file — read and decoded once per process."""
+    for path in paths:
+        try:
+            size = os.stat(path).st_size   # existence check + size in one syscall
+        except OSError:
+            continue
+        if size == 0:
+            return path, ""
+        with open(path, "rb") as f:
+            return path, f.read().decode("utf-8").strip()
+    return None, _DEFAULT_SYSTEM_PROMPT
+
+
+# WAL + relaxed fsync + mmap: far fewer fsyncs per conversation write
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=1073741824",
+    "PRAGMA cache_size=-65536",     # 64 MiB page cache per connection (negative = KiB)
+    "PRAGMA temp_store=MEMORY",     # sort/temp b-trees never touch disk
+)
+
+
+def _tune_sqlite(storage) -> None:
+    """Apply _SQLITE_PRAGMAS to every connection opened by a SqliteDb's engine."""
+    engine = getattr(storage, "db_engine", None)
+    if engine is None:
+        return
+    try:
+        from sqlalchemy import event
+    except ImportError:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _import_attr(module_path: str, attr_name: str):
+    """Import a module on first use and return one of its attributes."""
+    return getattr(importlib.import_module(module_path), attr_name)
+
 
 class AgnoBaseAgent(ABC):
     """
@@ -60,6 +126,20 @@ class AgnoBaseAgent(ABC):
                 return None  # optional custom tool routing
     """
 
+    # Skill name → (module, Toolkit class), imported only when a skill enables it.
+    # Agno built-ins resolve via AGNO_BUILTIN_REGISTRY.
+    _CUSTOM_TOOLKIT_REGISTRY = {
+        "calculator":      ("agno_single_agent_framework.tools.calculator",      "CalculatorToolkit"),
+        "web_search":      ("agno_single_agent_framework.tools.web_search",      "WebSearchToolkit"),
+        "http_request":    ("agno_single_agent_framework.tools.http_request",    "HTTPRequestToolkit"),
+        "email_sender":    ("agno_single_agent_framework.tools.email_sender",    "EmailSenderToolkit"),
+        "file_parser":     ("agno_single_agent_framework.tools.file_parser",     "FileParserToolkit"),
+        "database_lookup": ("agno_single_agent_framework.tools.database_lookup", "DatabaseLookupToolkit"),
+    }
+
+    # Resolved db_file → SqliteDb, so agents sharing a DB path share one handle
+    _SQLITE_DBS: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
+
     def __init__(
         self,
         name: str = "agent",
@@ -81,6 +161,11 @@ class AgnoBaseAgent(ABC):
         self.spec_path = spec_path
         self.skills_dir = skills_dir
         self._enable_observability = enable_observability
+        # No observability and no guardrails → skip per-request context bookkeeping
+        self._fast_path = not enable_observability and not enable_guardrails
+        # Only call the pre/post hooks when a subclass actually overrides them
+        self._has_before_hook = type(self).before_llm is not AgnoBaseAgent.before_llm
+        self._has_after_hook = type(self).after_llm is not AgnoBaseAgent.after_llm
 
         # Setup logging first — also wires Agno's internal logger
         setup_logging(
@@ -88,7 +173,7 @@ class AgnoBaseAgent(ABC):
             log_format=log_format, log_file=log_file,
         )
         self._logger = get_logger(name)
-        self._logger.info(f"Initializing Agno-powered agent: {name}")
+        self._logger.info("Initializing Agno-powered agent: %s", name)
 
         # Load system prompt
         self.system_prompt = self._load_system_prompt()
@@ -96,6 +181,8 @@ class AgnoBaseAgent(ABC):
         # Auto-discover and load skills from YAML files
         self.skill_loader = SkillLoader(skills_dir)
         self._toolkits = []
+        self._toolkits_by_name: Dict[str, Any] = {}
+        self.skill_loader.load_all()
         self._load_skills()
 
         # Determine model from spec or parameters
@@ -106,7 +193,7 @@ class AgnoBaseAgent(ABC):
         if enable_guardrails:
             pre_hooks, post_hooks = build_guardrail_hooks()
             self._logger.info(
-                f"Guardrails: {len(pre_hooks)} pre_hook(s), {len(post_hooks)} post_hook(s)"
+                "Guardrails: %d pre_hook(s), %d post_hook(s)", len(pre_hooks), len(post_hooks)
             )
 
         # Create Agno agent — guardrails attach here, enforced on every run
@@ -124,51 +211,48 @@ class AgnoBaseAgent(ABC):
             post_hooks=post_hooks,
         )
 
+        # Model is fixed for the agent's lifetime — snapshot for response metadata
+        self._model_id = self.agno_agent.model.id
+        self._model_name = self.agno_agent.model.name
+
         # User's setup hook (after Agno agent is created)
         self.setup()
 
         self._logger.info(
-            f"Agent '{name}' ready — {len(self._toolkits)} toolkits, "
-            f"guardrails={'on' if enable_guardrails else 'off'}"
+            "Agent '%s' ready — %d toolkits, guardrails=%s",
+            name, len(self._toolkits), "on" if enable_guardrails else "off",
         )
 
     def _load_system_prompt(self) -> str:
-        """Load system prompt from file if exists."""
-        for path in ["prompts/system_prompt.txt", "app/prompts/system_prompt.txt"]:
-            if os.path.exists(path):
-                with open(path, "r") as f:
-                    prompt = f.read().strip()
-                self._logger.debug(f"System prompt loaded from {path}")
-                return prompt
-        return "You are a helpful AI assistant."
+        """Load system prompt from file if exists (cached across agent instances)."""
+        path, prompt = _read_prompt(tuple(os.path.abspath(p) for p in _PROMPT_PATHS))
+        if path:
+            self._logger.debug("System prompt loaded from %s", path)
+        return prompt
 
     def _get_model_config(self, provider: Optional[str], model: Optional[str], spec_path: str) -> Dict:
         """Determine which Agno model to use based on configuration."""
         if os.path.exists(spec_path):
             try:
-                import yaml
-                with open(spec_path) as f:
-                    spec = yaml.safe_load(f)
+                with open(spec_path, "rb") as f:
+                    spec = yaml.load(f, Loader=_Loader)
                     llm_config = spec.get("llm", {})
                     provider = provider or llm_config.get("provider", "openai")
                     model = model or llm_config.get("model", "gpt-4o-mini")
             except Exception as e:
-                self._logger.warning(f"Could not load spec: {e}")
+                self._logger.warning("Could not load spec: %s", e)
                 provider = provider or "openai"
                 model = model or "gpt-4o-mini"
         else:
             provider = provider or "openai"
             model = model or "gpt-4o-mini"
 
-        if provider == "openai":
-            return {"provider": "openai", "model": model, "model_instance": OpenAI(id=model)}
-        elif provider == "anthropic":
-            return {"provider": "anthropic", "model": model, "model_instance": Claude(id=model)}
-        elif provider == "gemini":
-            return {"provider": "gemini", "model": model, "model_instance": Gemini(id=model)}
-        else:
-            self._logger.warning(f"Unknown provider '{provider}', defaulting to OpenAI")
-            return {"provider": "openai", "model": "gpt-4o-mini", "model_instance": OpenAI(id="gpt-4o-mini")}
+        if provider not in _PROVIDER_REGISTRY:
+            self._logger.warning("Unknown provider '%s', defaulting to OpenAI", provider)
+            provider, model = "openai", "gpt-4o-mini"
+
+        model_cls = _import_attr(*_PROVIDER_REGISTRY[provider])
+        return {"provider": provider, "model": model, "model_instance": model_cls(id=model)}
 
     def _create_storage(self, enable_memory: bool, storage_type: str, db_file: Optional[str], db_url: Optional[str]):
         """Create the appropriate storage backend for agent memory."""
@@ -185,54 +269,68 @@ class AgnoBaseAgent(ABC):
                     "PostgresAgentStorage not available (install: pip install psycopg2-binary), "
                     "falling back to SQLite"
                 )
-        return SqliteDb(db_file=db_file or f"{self.name}.db")
+        db_path = os.path.abspath(db_file or f"{self.name}.db")
+        storage = self._SQLITE_DBS.get(db_path)
+        if storage is None:
+            from agno.db.sqlite import SqliteDb
+            storage = SqliteDb(db_file=db_path)
+            _tune_sqlite(storage)
+            self._SQLITE_DBS[db_path] = storage
+        return storage
 
     def _load_skills(self):
-        """Auto-load skills from YAML files and create Agno toolkits."""
-        self.skill_loader.load_all()
-
-        custom_toolkit_registry = {
-            "calculator":      CalculatorToolkit,
-            "web_search":      WebSearchToolkit,
-            "http_request":    HTTPRequestToolkit,
-            "email_sender":    EmailSenderToolkit,
-            "file_parser":     FileParserToolkit,
-            "database_lookup": DatabaseLookupToolkit,
-        }
-
-        for skill in self.skill_loader.get_tools():
-            if skill.name in custom_toolkit_registry:
-                toolkit = custom_toolkit_registry[skill.name]()
-                self._toolkits.append(toolkit)
-                self._logger.info(f"🔧 Custom toolkit registered: {skill.name}")
+        """Create Agno toolkits for the loaded tool skills (diffed against existing ones)."""
+        tool_skills = self.skill_loader.get_tools()
+        desired = {skill.name for skill in tool_skills}
+
+        # Drop toolkits whose skill was removed or disabled
+        for name in self._toolkits_by_name.keys() - desired:
+            toolkit = self._toolkits_by_name.pop(name)
+            close = getattr(toolkit, "close", None)
+            if callable(close):
+                close()
+            self._logger.info("➖ Toolkit removed: %s", name)
+
+        # Instantiate only skills that don't already have a toolkit
+        for skill in tool_skills:
+            if skill.name in self._toolkits_by_name:
+                continue
+            entry = self._CUSTOM_TOOLKIT_REGISTRY.get(skill.name)
+            if entry:
+                self._toolkits_by_name[skill.name] = _import_attr(*entry)()
+                self._logger.info("🔧 Custom toolkit registered: %s", skill.name)
             elif skill.name in AGNO_BUILTIN_REGISTRY:
                 toolkit = load_agno_toolkit(skill.name)
                 if toolkit:
-                    self._toolkits.append(toolkit)
-                    self._logger.info(f"📦 Agno built-in toolkit registered: {skill.name}")
+                    self._toolkits_by_name[skill.name] = toolkit
+                    self._logger.info("📦 Agno built-in toolkit registered: %s", skill.name)
                 else:
-                    self._logger.warning(f"Agno toolkit '{skill.name}' could not be loaded (missing dependency?)")
+                    self._logger.warning("Agno toolkit '%s' could not be loaded (missing dependency?)", skill.name)
             else:
-                self._logger.warning(f"Unknown tool skill '{skill.name}' — not in custom or Agno registries")
+                self._logger.warning("Unknown tool skill '%s' — not in custom or Agno registries", skill.name)
+
+        self._toolkits = list(self._toolkits_by_name.values())
 
         for skill in self.skill_loader.get_integrations():
-            self._logger.info(f"🔗 Integration skill available: {skill.name}")
+            self._logger.info("🔗 Integration skill available: %s", skill.name)
 
         summary = self.skill_loader.summary()
         self._logger.info(
-            f"Skills summary: {summary['enabled']} enabled, "
-            f"{summary['disabled']} disabled, {summary['errors']} errors"
+            "Skills summary: %d enabled, %d disabled, %d errors",
+            summary["enabled"], summary["disabled"], summary["errors"],
         )
 
     def reload_skills(self):
-        """Hot-reload skills — re-scans the skills directory and recreates Agno agent."""
+        """
+        Hot-reload skills — re-scans the skills directory.
+        Unchanged skills keep their toolkit instance; only added/removed ones are touched.
+        """
         self._logger.info("♻️  Reloading skills...")
         self.skill_loader.reload()
         old_count = len(self._toolkits)
-        self._toolkits = []
         self._load_skills()
         self.agno_agent.tools = self._toolkits
-        self._logger.info(f"Reloaded: {old_count} → {len(self._toolkits)} toolkits")
+        self._logger.info("Reloaded: %d → %d toolkits", old_count, len(self._toolkits))
 
     # --- Hooks for subclasses ---
 
@@ -261,7 +359,7 @@ class AgnoBaseAgent(ABC):
         """Add a custom Agno toolkit to the agent."""
         self._toolkits.append(toolkit)
         self.agno_agent.tools.append(toolkit)
-        self._logger.info(f"Custom toolkit added: {toolkit.name}")
+        self._logger.info("Custom toolkit added: %s", toolkit.name)
 
     def get_skills_summary(self) -> Dict:
         """Get summary of loaded skills."""
@@ -277,20 +375,11 @@ class AgnoBaseAgent(ABC):
         If a pre_hook blocks the request, InputCheckError is raised and
         caught here — no manual checking needed.
         """
-        trace_id = new_trace()
-        start_time = time.time()
-
-        input_text = payload.get("input", "")
-        session_id = payload.get("session_id", "default")
-        request_id = payload.get("request_id", trace_id)
-
-        set_request_context(request_id, session_id)
-
+        request_id, session_id, input_text, start_time = self._begin_request(payload)
         try:
-            self._logger.info(f"Request received — session={session_id}")
-
             # Pre-processing hook
-            input_text = self.before_llm(input_text, {})
+            if self._has_before_hook:
+                input_text = self.before_llm(input_text, {})
 
             # Run Agno agent — pre_hooks (guardrails) fire here automatically
             agno_response = self.agno_agent.run(
@@ -298,60 +387,111 @@ class AgnoBaseAgent(ABC):
                 stream=False,
                 session_id=session_id,
             )
+            return self._response_result(request_id, agno_response, start_time)
 
-            output_text = (
-                agno_response.content
-                if hasattr(agno_response, "content")
-                else str(agno_response)
-            )
-            tool_calls = getattr(agno_response, "tool_calls", [])
+        except InputCheckError as e:
+            return self._blocked_result(request_id, e)
 
-            # Post-processing hook (post_hooks/guardrails already applied by Agno)
-            output_text = self.after_llm(output_text, {"tool_calls": tool_calls})
+        except Exception as e:
+            return self._error_result(request_id, e, start_time)
+
+        finally:
+            if not self._fast_path:
+                clear_request_context()
+
+    async def ahandle_request(self, payload: Dict) -> Dict:
+        """
+        Async variant of handle_request — awaits Agno's arun, so an async
+        server (FastAPI) keeps serving other requests during the LLM round-trip.
+        """
+        request_id, session_id, input_text, start_time = self._begin_request(payload)
+        try:
+            if self._has_before_hook:
+                input_text = self.before_llm(input_text, {})
 
-            latency_ms = (time.time() - start_time) * 1000
-            metrics = {}
-            if self._enable_observability:
-                metrics = log_run_metrics(self._logger, request_id, agno_response, latency_ms)
-
-            return {
-                "request_id": request_id,
-                "output": output_text,
-                "tool_calls": [{"tool": tc} for tc in tool_calls] if tool_calls else [],
-                "metadata": {
-                    "tokens_input":  metrics.get("input_tokens", 0),
-                    "tokens_output": metrics.get("output_tokens", 0),
-                    "model":         self.agno_agent.model.id,
-                    "provider":      self.agno_agent.model.name,
-                    "latency_ms":    round(latency_ms, 2),
-                    "agno_powered":  True,
-                },
-            }
+            agno_response = await self.agno_agent.arun(
+                input_text,
+                stream=False,
+                session_id=session_id,
+            )
+            return self._response_result(request_id, agno_response, start_time)
 
         except InputCheckError as e:
-            self._logger.warning(f"Request blocked by guardrail: {e}")
-            return {
-                "request_id": request_id,
-                "output": "I'm sorry, I can't process that request.",
-                "tool_calls": [],
-                "metadata": {"blocked": True, "reason": str(e)},
-            }
+            return self._blocked_result(request_id, e)
 
         except Exception as e:
-            latency_ms = (time.time() - start_time) * 1000
-            error_msg = str(e)
-            self._logger.error(f"Agent error: {e}", exc_info=True)
-            if self._enable_observability:
-                log_run_metrics(self._logger, request_id, None, latency_ms, status="fail", error=error_msg)
-            return {
-                "request_id": request_id,
-                "output": "An error occurred while processing your request.",
-                "tool_calls": [],
-                "metadata": {"error": error_msg},
-            }
+            return self._error_result(request_id, e, start_time)
 
         finally:
-            clear_request_context()
+            if not self._fast_path:
+                clear_request_context()
+
+    def _begin_request(self, payload: Dict) -> Tuple[str, str, str, float]:
+        trace_id = new_trace()
+        start_time = time.perf_counter()
+
+        input_text = payload.get("input", "")
+        session_id = payload.get("session_id", "default")
+        request_id = payload.get("request_id", trace_id)
+
+        if not self._fast_path:
+            set_request_context(request_id, session_id)
+
+        self._logger.info("Request received — session=%s", session_id)
+        return request_id, session_id, input_text, start_time
+
+    def _response_result(self, request_id: str, agno_response, start_time: float) -> Dict:
+        try:
+            output_text = agno_response.content
+        except AttributeError:
+            output_text = str(agno_response)
+        # Not every Agno run-response type carries tool_calls — keep this one guarded
+        tool_calls = getattr(agno_response, "tool_calls", None) or _EMPTY_TOOL_CALLS
+
+        # Post-processing hook (post_hooks/guardrails already applied by Agno)
+        if self._has_after_hook:
+            output_text = self.after_llm(output_text, {"tool_calls": tool_calls})
+
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        metrics = {}
+        if self._enable_observability:
+            metrics = log_run_metrics(self._logger, request_id, agno_response, latency_ms)
+
+        return {
+            "request_id": request_id,
+            "output": output_text,
+            "tool_calls": [{"tool": tc} for tc in tool_calls] if tool_calls else _EMPTY_TOOL_CALLS,
+            "metadata": {
+                "tokens_input":  metrics.get("input_tokens", 0),
+                "tokens_output": metrics.get("output_tokens", 0),
+                "model":         self._model_id,
+                "provider":      self._model_name,
+                "latency_ms":    round(latency_ms, 2),
+                "agno_powered":  True,
+            },
+        }
+
+    def _blocked_result(self, request_id: str, e: Exception) -> Dict:
+        self._logger.warning("Request blocked by guardrail: %s", e)
+        return {
+            "request_id": request_id,
+            "output": "I'm sorry, I can't process that request.",
+            "tool_calls": [],
+            "metadata": {"blocked": True, "reason": str(e)},
+        }
+
+    def _error_result(self, request_id: str, e: Exception, start_time: float) -> Dict:
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        error_msg = str(e)
+        self._logger.error("Agent error: %s", e, exc_info=True)
+        if self._enable_observability:
+            log_run_metrics(self._logger, request_id, None, latency_ms, status="fail", error=error_msg)
+        return {
+            "request_id": request_id,
+            "output": "An error occurred while processing your request.",
+            "tool_calls": [],
+            "metadata": {"error": error_msg},
+        }
 
     def stream_request(self, payload: Dict):
         """
@@ -366,7 +506,8 @@ class AgnoBaseAgent(ABC):
         input_text = payload.get("input", "")
         session_id = payload.get("session_id", "default")
 
-        input_text = self.before_llm(input_text, {})
+        if self._has_before_hook:
+            input_text = self.before_llm(input_text, {})
 
         try:
             for chunk in self.agno_agent.run(input_text, stream=True, session_id=session_id):
@@ -6,22 +6,60 @@ Adding a skill = drop a YAML file. Removing = delete it.
 """
 
 import os
+import json
 import time
+import asyncio
+import hashlib
 import logging
+import functools
+import contextvars
+from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC
 from typing import Optional, List, Dict, Any
 
 from agno_single_agent_framework.providers.llm_client import LLMClient, create_provider
 from agno_single_agent_framework.providers.base_provider import BaseLLMProvider, LLMResponse
 from agno_single_agent_framework.core.tool_router import ToolRouter
-from agno_single_agent_framework.core.memory import MemoryManager
+from agno_single_agent_framework.core.memory import MemoryManager, select_relevant
 from agno_single_agent_framework.core.skill_loader import SkillLoader, Skill
 from agno_single_agent_framework.services.guardrails import Guardrails
 from agno_single_agent_framework.services.observability import StructuredLogger, new_trace
 from agno_single_agent_framework.services.logging import setup_logging, set_request_context, clear_request_context, get_logger
+from agno_single_agent_framework.tools._cache import TTLCache, SQLiteCache
 
 logger = logging.getLogger(__name__)
 
+# Exact-match LLM response cache (opt-in via response_cache_ttl)
+_RESPONSE_CACHE_SIZE = 10_000
+
+# Worker threads for loading out-of-process memory (e.g. Redis) while the
+# input guardrails run; threads are only started once first used
+_MEMORY_LOADER = ThreadPoolExecutor(max_workers=8, thread_name_prefix="memory-load")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_prompt_cached(paths: tuple) -> Optional[tuple]:
+    """(prompt, path) for the first existing prompt file — read once per process."""
+    for path in paths:
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return f.read().decode().strip(), path
+    return None
+
+
+def _format_memory(context: List[Dict]) -> str:
+    """
+    Session history as a system block. Rendering is deterministic and
+    append-only — each turn only extends the previous block — so the
+    request prefix stays byte-stable for provider-side prompt caching.
+    """
+    lines = ["Previous conversation in this session:"]
+    for entry in context:
+        for role, text in entry.items():
+            lines.append(f"{role}: {text}")
+    return "\n".join(lines)
+
 
 class BaseAgent(ABC):
     """
@@ -41,6 +79,9 @@ class BaseAgent(ABC):
                 return None
     """
 
+    # Searched in order; the first existing file becomes the system prompt
+    _PROMPT_PATHS = ("prompts/system_prompt.txt", "app/prompts/system_prompt.txt")
+
     def __init__(
         self,
         name: str = "agent",
@@ -52,6 +93,9 @@ class BaseAgent(ABC):
         log_level: str = "INFO",
         log_format: str = "pretty",
         log_file: Optional[str] = None,
+        response_cache_ttl: float = 0,
+        response_cache_path: Optional[str] = None,
+        memory_recall_k: Optional[int] = None,
     ):
         self.name = name
         self.spec_path = spec_path
@@ -68,9 +112,20 @@ class BaseAgent(ABC):
         self._logger.info(f"Initializing agent: {name}")
         self.llm = LLMClient(provider=provider, spec_path=spec_path)
         self.memory = MemoryManager()
+        # None: full history in every prompt. k: recent turns + k most relevant older ones
+        self._memory_recall_k = memory_recall_k
         self.tool_router = ToolRouter()
         self.guardrails = Guardrails() if enable_guardrails else None
         self.obs_logger = StructuredLogger(agent_name=name) if enable_observability else None
+        # Identical prompts (system + memory + turn) reuse the LLM answer for
+        # response_cache_ttl seconds; 0 disables — sampled output becomes sticky.
+        # response_cache_path persists the cache in SQLite across restarts.
+        self._response_cache = None
+        if response_cache_ttl > 0:
+            if response_cache_path:
+                self._response_cache = SQLiteCache(response_cache_path, _RESPONSE_CACHE_SIZE, response_cache_ttl)
+            else:
+                self._response_cache = TTLCache(_RESPONSE_CACHE_SIZE, response_cache_ttl)
 
         # Load system prompt
         self.system_prompt = "You are a helpful AI assistant."
@@ -85,14 +140,22 @@ class BaseAgent(ABC):
 
         self._logger.info(f"Agent '{name}' ready — {len(self.tool_router.list_tools())} tools loaded")
 
+    @property
+    def system_prompt(self) -> str:
+        return self._system_msg["content"]
+
+    @system_prompt.setter
+    def system_prompt(self, value: str):
+        # Built once and reused as the first message of every request
+        self._system_msg = {"role": "system", "content": value}
+
     def _load_system_prompt(self):
         """Load system prompt from file if exists."""
-        for path in ["prompts/system_prompt.txt", "app/prompts/system_prompt.txt"]:
-            if os.path.exists(path):
-                with open(path, "r") as f:
-                    self.system_prompt = f.read().strip()
-                self._logger.debug(f"System prompt loaded from {path}")
-                break
+        # Keyed by absolute path so a changed working directory can't hit a stale entry
+        loaded = _load_prompt_cached(tuple(os.path.abspath(p) for p in self._PROMPT_PATHS))
+        if loaded:
+            self.system_prompt, path = loaded
+            self._logger.debug(f"System prompt loaded from {path}")
 
     def _load_skills(self):
         """Auto-load skills from YAML files and register them."""
@@ -184,10 +247,27 @@ class BaseAgent(ABC):
 
     # --- Main Request Handler ---
 
+    def _response_cache_key(self, messages: List[Dict]) -> bytes:
+        """16-byte digest of provider, model and the exact message list."""
+        provider = self.llm.provider
+        raw = json.dumps(
+            [provider.get_provider_name(), provider.model, messages],
+            ensure_ascii=False, separators=(",", ":"), default=str,
+        )
+        return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+    async def ahandle_request(self, payload: Dict) -> Dict:
+        """
+        Async entry point for async servers. The legacy providers are
+        synchronous, so the pipeline runs on a worker thread (request
+        context is carried over) instead of blocking the event loop.
+        """
+        return await asyncio.to_thread(self.handle_request, payload)
+
     def handle_request(self, payload: Dict) -> Dict:
         """Process a request through the full pipeline."""
         trace_id = new_trace()
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()   # monotonic; latency only, never wall-clock
 
         input_text = payload.get("input", "")
         session_id = payload.get("session_id", "default")
@@ -198,15 +278,22 @@ class BaseAgent(ABC):
 
         tool_calls = []
         error = None
+        pending = None
 
         try:
-            self._logger.info(f"Request received — session={session_id}")
+            self._logger.info("Request received — session=%s", session_id)
+
+            # The memory load doesn't depend on the input check — for backends
+            # that do I/O, overlap it with the guardrails instead of waiting twice
+            if self.guardrails and type(self.memory) is not MemoryManager:
+                # Carry the request's logging context over to the worker thread
+                pending = _MEMORY_LOADER.submit(contextvars.copy_context().run, self.memory.load, session_id)
 
             # 1. Input guardrails
             if self.guardrails:
                 safety = self.guardrails.check_input(input_text)
                 if safety.get("blocked"):
-                    self._logger.warning(f"Request blocked: {safety.get('reason')}")
+                    self._logger.warning("Request blocked: %s", safety.get("reason"))
                     return {
                         "request_id": request_id,
                         "output": "I'm sorry, I can't process that request.",
@@ -215,11 +302,18 @@ class BaseAgent(ABC):
                     }
                 input_text = safety["sanitized_text"]
                 if safety.get("warnings"):
-                    self._logger.info(f"Input warnings: {safety['warnings']}")
+                    self._logger.info("Input warnings: %s", safety["warnings"])
 
             # 2. Load memory
-            context = self.memory.load(session_id)
-            self._logger.debug(f"Memory loaded — {len(context)} entries")
+            if pending is not None:
+                context = pending.result()
+                if self._memory_recall_k is not None:
+                    context = select_relevant(context, input_text, k=self._memory_recall_k)
+            elif self._memory_recall_k is None:
+                context = self.memory.load(session_id)
+            else:
+                context = self.memory.recall(session_id, input_text, k=self._memory_recall_k)
+            self._logger.debug("Memory loaded — %d entries", len(context))
 
             # 3. Pre-processing hook
             input_text = self.before_llm(input_text, context)
@@ -229,29 +323,41 @@ class BaseAgent(ABC):
             tool_result = self.route_tools(input_text, available)
             if tool_result:
                 tool_calls.append(tool_result)
-                self._logger.info(f"Tool called: {tool_result.get('tool', 'unknown')}")
+                self._logger.info("Tool called: %s", tool_result.get("tool", "unknown"))
 
-            # 5. Build messages
-            messages = [{"role": "system", "content": self.system_prompt}]
+            # 5. Build messages — fixed system prompt first, then memory, then the turn
+            messages = [self._system_msg]
             if context:
-                messages.append({"role": "user", "content": f"Previous context: {context}"})
+                messages.append({"role": "system", "content": _format_memory(context)})
             user_content = input_text
             if tool_result:
-                user_content += f"\n\n[Tool Result]: {tool_result}"
+                user_content = "".join((user_content, "\n\n[Tool Result]: ", str(tool_result)))
             messages.append({"role": "user", "content": user_content})
 
-            # 6. LLM generation
-            self._logger.debug(f"Sending to LLM — {len(messages)} messages")
-            llm_response = self.llm.generate(messages)
-
-            if llm_response.error:
-                self._logger.error(f"LLM error: {llm_response.error}")
-            else:
-                self._logger.info(
-                    f"LLM response — tokens_in={llm_response.tokens_input}, "
-                    f"tokens_out={llm_response.tokens_output}, "
-                    f"cost=${llm_response.cost_estimate:.4f}"
-                )
+            # 6. LLM generation (exact-match cache first, if enabled)
+            cache_key = None
+            llm_response = None
+            if self._response_cache is not None:
+                cache_key = self._response_cache_key(messages)
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    # Fresh object per hit (hooks may mutate it); no tokens were spent
+                    llm_response = LLMResponse(**{**cached, "tokens_input": 0, "tokens_output": 0, "cost_estimate": 0.0})
+                    self._logger.info("LLM response served from cache")
+
+            if llm_response is None:
+                self._logger.debug("Sending to LLM — %d messages", len(messages))
+                llm_response = self.llm.generate(messages)
+
+                if llm_response.error:
+                    self._logger.error("LLM error: %s", llm_response.error)
+                else:
+                    self._logger.info(
+                        "LLM response — tokens_in=%d, tokens_out=%d, cost=$%.4f",
+                        llm_response.tokens_input, llm_response.tokens_output, llm_response.cost_estimate,
+                    )
+                    if cache_key is not None:
+                        self._response_cache.set(cache_key, asdict(llm_response))
 
             # 7. Post-processing hook
             llm_response = self.after_llm(llm_response)
@@ -262,13 +368,13 @@ class BaseAgent(ABC):
                 output_safety = self.guardrails.check_output(output_text)
                 output_text = output_safety["sanitized_text"]
                 if output_safety.get("warnings"):
-                    self._logger.info(f"Output warnings: {output_safety['warnings']}")
+                    self._logger.info("Output warnings: %s", output_safety["warnings"])
 
             # 9. Save memory
             self.memory.save(session_id, {"user": input_text, "assistant": output_text})
 
             # 10. Observability log
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter_ns() - start_ns) / 1e6
             if self.obs_logger:
                 self.obs_logger.log_request(
                     request_id=request_id, status="success",
@@ -279,7 +385,7 @@ class BaseAgent(ABC):
                     model_name=llm_response.model,
                 )
 
-            self._logger.info(f"Request completed — {latency_ms:.0f}ms")
+            self._logger.info("Request completed — %.0fms", latency_ms)
 
             return {
                 "request_id": request_id,
@@ -291,17 +397,17 @@ class BaseAgent(ABC):
                     "cost_estimate": llm_response.cost_estimate,
                     "model": llm_response.model,
                     "provider": self.llm.provider.get_provider_name(),
-                    "latency_ms": round((time.time() - start_time) * 1000, 2),
+                    "latency_ms": round(latency_ms, 2),
                 },
             }
 
         except Exception as e:
             error = str(e)
-            self._logger.error(f"Agent error: {e}", exc_info=True)
+            self._logger.error("Agent error: %s", e, exc_info=True)
             if self.obs_logger:
                 self.obs_logger.log_request(
                     request_id=request_id, status="fail",
-                    latency_ms=(time.time() - start_time) * 1000,
+                    latency_ms=(time.perf_counter_ns() - start_ns) / 1e6,
                     error=error,
                 )
             return {
@@ -312,4 +418,8 @@ class BaseAgent(ABC):
             }
 
         finally:
+            if pending is not None:
+                # Blocked or failed before the load was collected — drop it if
+                # it hasn't started; a no-op once it has been consumed
+                pending.cancel()
             clear_request_context()
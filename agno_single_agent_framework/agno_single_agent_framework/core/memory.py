@@ -4,11 +4,37 @@ Memory Manager — Session state management.
 Default: in-memory dict. Override with Redis/DB for production.
 """
 
+import re
+import heapq
 import logging
 from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r"\w+")
+
+
+def _terms(text: str) -> set:
+    return set(_WORD_RE.findall(text.lower()))
+
+
+def select_relevant(history: List[Dict], query: str, k: int = 5, recent: int = 3) -> List[Dict]:
+    """
+    Bounded history for a prompt: the `recent` latest entries plus the `k`
+    older entries sharing the most terms with `query`, in original order.
+    """
+    if len(history) <= k + recent:
+        return history
+    older = history[:-recent] if recent else history
+    latest = history[-recent:] if recent else []
+    query_terms = _terms(query)
+    best = heapq.nlargest(
+        k, range(len(older)),
+        # Ties go to the newer entry
+        key=lambda i: (len(query_terms & _terms(" ".join(map(str, older[i].values())))), i),
+    )
+    return [older[i] for i in sorted(best)] + latest
+
 
 class MemoryManager:
     """
@@ -37,6 +63,13 @@ class MemoryManager:
         """Get last N entries from session."""
         return self._store.get(session_id, [])[-n:]
 
+    def recall(self, session_id: str, query: str, k: int = 5, recent: int = 3) -> List[Dict]:
+        """
+        Session history bounded by select_relevant().
+        Works for any backend that implements load().
+        """
+        return select_relevant(self.load(session_id), query, k=k, recent=recent)
+
 
 class RedisMemoryManager(MemoryManager):
     """
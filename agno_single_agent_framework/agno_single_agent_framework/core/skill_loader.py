@@ -23,14 +23,23 @@ Full YAML for a custom skill:
 """
 
 import os
-import glob
+import sys
+import functools
 import importlib
 import logging
-from typing import Dict, List, Optional, Any
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any
 from dataclasses import dataclass, field
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 logger = logging.getLogger(__name__)
 
 # Skills directory shipped inside the package — resolved relative to this file
@@ -46,39 +55,116 @@ _PACKAGE_SKILLS_DIR = os.path.normpath(
 # No Python code needed.
 # ──────────────────────────────────────────────────────────────
 
-BUILTIN_SKILLS: Dict[str, Dict[str, str]] = {
+BuiltinInfo = namedtuple("BuiltinInfo", "type module description")
+
+_TOOL = sys.intern("tool")
+_INTEGRATION = sys.intern("integration")
+
+BUILTIN_SKILLS: Mapping[str, BuiltinInfo] = MappingProxyType({
     # ── Custom Toolkits (our full implementations) ───────────────────────────
-    "calculator":       {"type": "tool",        "module": "agno_single_agent_framework.tools.calculator",       "description": "Arithmetic operations — add, subtract, multiply, divide"},
-    "web_search":       {"type": "tool",        "module": "agno_single_agent_framework.tools.web_search",       "description": "Search the web via Tavily or SerpAPI"},
-    "database_lookup":  {"type": "tool",        "module": "agno_single_agent_framework.tools.database_lookup",  "description": "Read-only SQL queries on PostgreSQL/MySQL"},
-    "http_request":     {"type": "tool",        "module": "agno_single_agent_framework.tools.http_request",     "description": "Make HTTP GET/POST/PUT requests to APIs"},
-    "email_sender":     {"type": "tool",        "module": "agno_single_agent_framework.tools.email_sender",     "description": "Send emails via SMTP"},
-    "file_parser":      {"type": "tool",        "module": "agno_single_agent_framework.tools.file_parser",      "description": "Extract text from PDF, DOCX, CSV, Excel, TXT"},
+    "calculator":       BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.calculator",       "Arithmetic operations — add, subtract, multiply, divide"),
+    "web_search":       BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.web_search",       "Search the web via Tavily or SerpAPI"),
+    "database_lookup":  BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.database_lookup",  "Read-only SQL queries on PostgreSQL/MySQL"),
+    "http_request":     BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.http_request",     "Make HTTP GET/POST/PUT requests to APIs"),
+    "email_sender":     BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.email_sender",     "Send emails via SMTP"),
+    "file_parser":      BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.file_parser",      "Extract text from PDF, DOCX, CSV, Excel, TXT"),
 
     # ── Agno Built-in Toolkits (ready-made from Agno ecosystem) ─────────────
-    "duckduckgo":       {"type": "tool",        "module": "agno_single_agent_framework.tools.agno_builtin",     "description": "DuckDuckGo web search — no API key required"},
-    "hackernews":       {"type": "tool",        "module": "agno_single_agent_framework.tools.agno_builtin",     "description": "Hacker News top stories, newest posts, and details"},
-    "wikipedia":        {"type": "tool",        "module": "agno_single_agent_framework.tools.agno_builtin",     "description": "Search and retrieve Wikipedia articles"},
-    "yfinance":         {"type": "tool",        "module": "agno_single_agent_framework.tools.agno_builtin",     "description": "Yahoo Finance — stock prices, company info, analyst recommendations"},
-    "arxiv":            {"type": "tool",        "module": "agno_single_agent_framework.tools.agno_builtin",     "description": "ArXiv academic paper search"},
-    "newspaper":        {"type": "tool",        "module": "agno_single_agent_framework.tools.agno_builtin",     "description": "Fetch and parse news articles from URLs"},
-    "exa":              {"type": "tool",        "module": "agno_single_agent_framework.tools.agno_builtin",     "description": "Exa AI semantic search — requires EXA_API_KEY"},
-    "tavily":           {"type": "tool",        "module": "agno_single_agent_framework.tools.agno_builtin",     "description": "Tavily AI-optimized search — requires TAVILY_API_KEY"},
-    "github":           {"type": "tool",        "module": "agno_single_agent_framework.tools.agno_builtin",     "description": "GitHub repo search, files, issues — requires GITHUB_TOKEN"},
-    "resend":           {"type": "tool",        "module": "agno_single_agent_framework.tools.agno_builtin",     "description": "Resend email API — requires RESEND_API_KEY"},
-    "python_exec":      {"type": "tool",        "module": "agno_single_agent_framework.tools.agno_builtin",     "description": "Execute Python code — use only in trusted environments"},
-    "shell":            {"type": "tool",        "module": "agno_single_agent_framework.tools.agno_builtin",     "description": "Execute shell commands — use only in trusted environments"},
-    "spider":           {"type": "tool",        "module": "agno_single_agent_framework.tools.agno_builtin",     "description": "Spider web crawler — crawl entire sites, extract content — requires SPIDER_API_KEY"},
-    "firecrawl":        {"type": "tool",        "module": "agno_single_agent_framework.tools.agno_builtin",     "description": "Firecrawl web scraper — LLM-ready markdown output — requires FIRECRAWL_API_KEY"},
+    "duckduckgo":       BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.agno_builtin",     "DuckDuckGo web search — no API key required"),
+    "hackernews":       BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.agno_builtin",     "Hacker News top stories, newest posts, and details"),
+    "wikipedia":        BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.agno_builtin",     "Search and retrieve Wikipedia articles"),
+    "yfinance":         BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.agno_builtin",     "Yahoo Finance — stock prices, company info, analyst recommendations"),
+    "arxiv":            BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.agno_builtin",     "ArXiv academic paper search"),
+    "newspaper":        BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.agno_builtin",     "Fetch and parse news articles from URLs"),
+    "exa":              BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.agno_builtin",     "Exa AI semantic search — requires EXA_API_KEY"),
+    "tavily":           BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.agno_builtin",     "Tavily AI-optimized search — requires TAVILY_API_KEY"),
+    "github":           BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.agno_builtin",     "GitHub repo search, files, issues — requires GITHUB_TOKEN"),
+    "resend":           BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.agno_builtin",     "Resend email API — requires RESEND_API_KEY"),
+    "python_exec":      BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.agno_builtin",     "Execute Python code — use only in trusted environments"),
+    "shell":            BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.agno_builtin",     "Execute shell commands — use only in trusted environments"),
+    "spider":           BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.agno_builtin",     "Spider web crawler — crawl entire sites, extract content — requires SPIDER_API_KEY"),
+    "firecrawl":        BuiltinInfo(_TOOL,       "agno_single_agent_framework.tools.agno_builtin",     "Firecrawl web scraper — LLM-ready markdown output — requires FIRECRAWL_API_KEY"),
 
     # ── Integrations (FastAPI routers) ───────────────────────────────────────
-    "webhook":          {"type": "integration", "module": "agno_single_agent_framework.integrations.webhook",   "description": "Generic inbound webhook with HMAC verification"},
-    "whatsapp":         {"type": "integration", "module": "agno_single_agent_framework.integrations.whatsapp",  "description": "WhatsApp Cloud API two-way messaging"},
-    "slack":            {"type": "integration", "module": "agno_single_agent_framework.integrations.slack",     "description": "Slack bot via Socket Mode"},
+    "webhook":          BuiltinInfo(_INTEGRATION,"agno_single_agent_framework.integrations.webhook",   "Generic inbound webhook with HMAC verification"),
+    "whatsapp":         BuiltinInfo(_INTEGRATION,"agno_single_agent_framework.integrations.whatsapp",  "WhatsApp Cloud API two-way messaging"),
+    "slack":            BuiltinInfo(_INTEGRATION,"agno_single_agent_framework.integrations.slack",     "Slack bot via Socket Mode"),
+})
+
+
+# list_available_skills() payload — BUILTIN_SKILLS is read-only, so build it once
+_AVAILABLE_SKILLS_INFO: Dict[str, Dict[str, str]] = {
+    name: {"type": info.type, "description": info.description}
+    for name, info in BUILTIN_SKILLS.items()
 }
 
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def _cached_import(module_path: str):
+    """Import a module once per process — many built-in skills share one module."""
+    module = sys.modules.get(module_path)
+    # Skip the fast path for a module that is still mid-import (circular import)
+    spec = getattr(module, "__spec__", None)
+    if spec is not None and getattr(spec, "_initializing", False) is False:
+        return module
+    return importlib.import_module(module_path)
+
+
+# Upper bound on threads used to read/parse skill files in load_all()
+_MAX_PARSE_WORKERS = 8
+
+
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+
+def _compose_skill_yaml(stream):
+    """
+    Load a skill document, leaving the top-level `config` value as an unbuilt
+    yaml node. Only enabled skills need their config, so large config blocks
+    in disabled skill files are never turned into Python objects.
+    """
+    loader = _Loader(stream)
+    try:
+        root = loader.get_single_node()
+        if root is None:
+            return None
+        # Non-mapping roots and top-level merge keys take the regular path
+        if not isinstance(root, yaml.MappingNode) or any(k.tag == _MERGE_TAG for k, _ in root.value):
+            return loader.construct_document(root)
+        data = {}
+        for key_node, value_node in root.value:
+            key = loader.construct_object(key_node, deep=True)
+            data[key] = value_node if key == "config" else loader.construct_object(value_node, deep=True)
+        return data
+    finally:
+        loader.dispose()
+
+
+def _construct_node(node):
+    """Build the Python value for a node left unbuilt by _compose_skill_yaml."""
+    loader = _Loader("")
+    try:
+        return loader.construct_document(node)
+    finally:
+        loader.dispose()
+
+
+def _read_skill_yaml(filepath: str):
+    """Read and parse one skill file. Returns (data, error) — safe to run on a worker thread."""
+    try:
+        # libyaml decodes UTF-8 itself — hand it raw bytes
+        with open(filepath, "rb") as f:
+            return _compose_skill_yaml(f), None
+    except Exception as e:
+        return None, e
+
+
+# slots=True drops the per-instance __dict__; it needs Python 3.10+, and the
+# package still supports 3.9.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Skill:
     """Represents a loaded skill."""
     name: str
@@ -107,12 +193,13 @@ class SkillLoader:
         enabled: true
     """
 
-    VALID_TYPES = {"tool", "integration", "mcp", "function"}
+    VALID_TYPES = frozenset(map(sys.intern, ("tool", "integration", "mcp", "function")))
 
     def __init__(self, skills_dir: str = None):
         self.skills_dir = skills_dir or _PACKAGE_SKILLS_DIR
         self.skills: Dict[str, Skill] = {}
         self._errors: List[str] = []
+        self._by_type: Dict[str, List[Skill]] = defaultdict(list)
 
     # --- Discovery & Loading ---
 
@@ -122,15 +209,24 @@ class SkillLoader:
             logger.warning(f"Skills directory not found: {self.skills_dir}")
             return self
 
-        yaml_files = sorted(
-            glob.glob(os.path.join(self.skills_dir, "*.yaml"))
-            + glob.glob(os.path.join(self.skills_dir, "*.yml"))
-        )
+        # One directory pass; DirEntry.is_file() uses cached dirent type (no stat per entry)
+        with os.scandir(self.skills_dir) as it:
+            yaml_files = sorted(
+                e.path for e in it
+                if e.name.endswith((".yaml", ".yml"))
+                and not e.name.startswith(".")   # glob skipped hidden files too
+                and e.is_file()
+            )
 
         logger.info(f"📂 Scanning {self.skills_dir}/ — found {len(yaml_files)} skill file(s)")
 
-        for filepath in yaml_files:
-            self._load_skill_file(filepath)
+        # File reads and libyaml parsing run in parallel; validation, imports and
+        # registration stay sequential in sorted order so results are deterministic.
+        with ThreadPoolExecutor(max_workers=min(_MAX_PARSE_WORKERS, len(yaml_files) or 1)) as ex:
+            parsed = list(ex.map(_read_skill_yaml, yaml_files))
+
+        for filepath, result in zip(yaml_files, parsed):
+            self._load_skill_file(filepath, result)
 
         loaded = [s.name for s in self.skills.values() if s.enabled]
         disabled = [s.name for s in self.skills.values() if not s.enabled]
@@ -145,12 +241,13 @@ class SkillLoader:
 
         return self
 
-    def _load_skill_file(self, filepath: str):
-        """Parse a single YAML skill file."""
+    def _load_skill_file(self, filepath: str, parsed=None):
+        """Validate and register a single YAML skill file (parsed here unless already done)."""
         filename = os.path.basename(filepath)
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data, error = parsed if parsed is not None else _read_skill_yaml(filepath)
+            if error is not None:
+                raise error
 
             if not data or not isinstance(data, dict):
                 self._errors.append(f"{filename}: Empty or invalid YAML")
@@ -165,17 +262,33 @@ class SkillLoader:
             builtin = BUILTIN_SKILLS.get(name)
             is_builtin = builtin is not None
 
+            # Disabled skills are never imported — record them as-is and skip
+            # type/module validation entirely.
+            if not data.get("enabled", True):
+                self._register(Skill(
+                    name=name,
+                    type=data.get("type") or (builtin.type if is_builtin else _TOOL),
+                    module_path=data.get("module") or (builtin.module if is_builtin else ""),
+                    description=data.get("description") or (builtin.description if is_builtin else ""),
+                    enabled=False,
+                    source_file=filepath,
+                    is_builtin=is_builtin,
+                ))
+                return
+
             # Type: explicit > builtin > error
-            skill_type = data.get("type") or (builtin["type"] if builtin else None)
+            skill_type = data.get("type") or (builtin.type if builtin else None)
             if not skill_type:
                 self._errors.append(f"{filename}: Missing 'type' — and '{name}' is not a built-in skill")
                 return
+            if isinstance(skill_type, str):
+                skill_type = sys.intern(skill_type)
             if skill_type not in self.VALID_TYPES:
-                self._errors.append(f"{filename}: Invalid type '{skill_type}'. Must be: {self.VALID_TYPES}")
+                self._errors.append(f"{filename}: Invalid type '{skill_type}'. Must be: {sorted(self.VALID_TYPES)}")
                 return
 
             # Module: explicit > builtin > error
-            module_path = data.get("module") or (builtin["module"] if builtin else None)
+            module_path = data.get("module") or (builtin.module if builtin else None)
             if not module_path:
                 self._errors.append(
                     f"{filename}: Missing 'module' — and '{name}' is not a built-in skill. "
@@ -184,35 +297,46 @@ class SkillLoader:
                 return
 
             # Description: explicit > builtin > default
-            description = data.get("description") or (builtin.get("description", "") if builtin else "")
+            description = data.get("description") or (builtin.description if builtin else "")
+
+            config = data.get("config", {})
+            if isinstance(config, yaml.Node):
+                config = _construct_node(config)
 
             skill = Skill(
                 name=name,
                 type=skill_type,
                 module_path=module_path,
                 description=description,
-                enabled=data.get("enabled", True),
-                config=data.get("config", {}),
+                enabled=True,
+                config=config,
                 source_file=filepath,
                 is_builtin=is_builtin,
             )
 
-            if skill.enabled:
-                skill.module = self._import_module(module_path, filename)
-                if skill.module is None:
-                    return
+            skill.module = self._import_module(module_path, filename)
+            if skill.module is None:
+                return
 
-            self.skills[name] = skill
+            self._register(skill)
 
         except yaml.YAMLError as e:
             self._errors.append(f"{filename}: YAML parse error — {e}")
         except Exception as e:
             self._errors.append(f"{filename}: Unexpected error — {e}")
 
+    def _register(self, skill: Skill):
+        """Store a skill by name and keep the type index in step."""
+        previous = self.skills.get(skill.name)
+        if previous is not None:
+            self._by_type[previous.type].remove(previous)
+        self.skills[skill.name] = skill
+        self._by_type[skill.type].append(skill)
+
     def _import_module(self, module_path: str, source: str):
         """Import a Python module by dotted path."""
         try:
-            return importlib.import_module(module_path)
+            return _cached_import(module_path)
         except ImportError as e:
             self._errors.append(f"{source}: Cannot import '{module_path}' — {e}")
             return None
@@ -227,7 +351,7 @@ class SkillLoader:
         return [s for s in skills if s.enabled] if enabled_only else skills
 
     def get_by_type(self, skill_type: str, enabled_only: bool = True) -> List[Skill]:
-        return [s for s in self.get_all(enabled_only) if s.type == skill_type]
+        return [s for s in self._by_type.get(skill_type, ()) if not enabled_only or s.enabled]
 
     def get_tools(self) -> List[Skill]:
         return self.get_by_type("tool")
@@ -257,6 +381,7 @@ class SkillLoader:
         """Re-scan skills/. New files picked up, deleted files dropped."""
         self.skills.clear()
         self._errors.clear()
+        self._by_type.clear()
         return self.load_all()
 
     # --- Registry Info ---
@@ -264,26 +389,31 @@ class SkillLoader:
     @staticmethod
     def list_available_skills() -> Dict[str, Dict]:
         """List all built-in skills available in the SDK."""
-        return {
-            name: {"type": info["type"], "description": info.get("description", "")}
-            for name, info in BUILTIN_SKILLS.items()
-        }
+        return dict(_AVAILABLE_SKILLS_INFO)
 
     # --- Summary ---
 
     def summary(self) -> Dict:
+        # Single pass over the registry; by_type counts enabled skills only
+        total = enabled = 0
+        by_type = dict.fromkeys(self.VALID_TYPES, 0)
+        skills = []
+        for s in self.skills.values():
+            total += 1
+            if s.enabled:
+                enabled += 1
+                if s.type in by_type:
+                    by_type[s.type] += 1
+            skills.append({
+                "name": s.name, "type": s.type,
+                "enabled": s.enabled, "builtin": s.is_builtin,
+                "description": s.description,
+            })
         return {
-            "total": len(self.skills),
-            "enabled": len([s for s in self.skills.values() if s.enabled]),
-            "disabled": len([s for s in self.skills.values() if not s.enabled]),
-            "by_type": {t: len(self.get_by_type(t)) for t in self.VALID_TYPES},
+            "total": total,
+            "enabled": enabled,
+            "disabled": total - enabled,
+            "by_type": by_type,
             "errors": len(self._errors),
-            "skills": [
-                {
-                    "name": s.name, "type": s.type,
-                    "enabled": s.enabled, "builtin": s.is_builtin,
-                    "description": s.description,
-                }
-                for s in self.skills.values()
-            ],
+            "skills": skills,
         }
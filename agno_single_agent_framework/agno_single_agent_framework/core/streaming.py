@@ -0,0 +1,82 @@
+"""
+Streaming helpers — coalesce model token chunks into larger frames and send
+pre-encoded frames over a raw ASGI channel.
+"""
+
+import asyncio
+from typing import AsyncIterable, AsyncIterator
+
+
+async def batch_chunks(chunks: AsyncIterable, max_tokens: int, max_ms: float) -> AsyncIterator[str]:
+    """
+    Join the `.content` of streamed chunks into batches.
+
+    A batch is emitted when max_tokens non-empty chunks are buffered or max_ms
+    has passed since the first of them — a quiet model still flushes on time
+    because the next chunk is awaited with a deadline. asyncio.wait (not
+    wait_for) so a timeout never cancels the underlying stream.
+    """
+    loop = asyncio.get_running_loop()
+    stream = chunks.__aiter__()
+    pending = None
+    buf = []
+    flush_at = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(stream.__anext__())
+            timeout = max(0.0, flush_at - loop.time()) if buf else None
+            done, _ = await asyncio.wait((pending,), timeout=timeout)
+            if done:
+                task, pending = pending, None
+                try:
+                    chunk = task.result()
+                except StopAsyncIteration:
+                    break
+                if not chunk.content:
+                    continue
+                if not buf:
+                    flush_at = loop.time() + max_ms / 1000
+                buf.append(chunk.content)
+                if len(buf) < max_tokens and loop.time() < flush_at:
+                    continue
+            if buf:
+                yield "".join(buf)
+                buf.clear()
+
+        if buf:
+            yield "".join(buf)
+    finally:
+        if pending is not None:   # consumer went away mid-stream
+            pending.cancel()
+
+
+async def send_frames(frames: AsyncIterator[bytes], receive, send) -> None:
+    """
+    Send pre-encoded body frames over an ASGI channel, then end the body.
+
+    receive() is watched for http.disconnect alongside the send loop, as
+    StreamingResponse does: servers make send() a no-op once the client is
+    gone, so without the watch an abandoned stream would run to the end.
+    On disconnect the send loop is cancelled and the frame generator closed.
+    """
+    async def pump():
+        async for frame in frames:
+            await send({"type": "http.response.body", "body": frame, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def watch():
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    sender = asyncio.ensure_future(pump())
+    watcher = asyncio.ensure_future(watch())
+    try:
+        done, _ = await asyncio.wait((sender, watcher), return_when=asyncio.FIRST_COMPLETED)
+        if sender in done:
+            sender.result()   # surface errors from the frame generator
+    finally:
+        for task in (sender, watcher):
+            task.cancel()
+        await asyncio.gather(sender, watcher, return_exceptions=True)
+        await frames.aclose()
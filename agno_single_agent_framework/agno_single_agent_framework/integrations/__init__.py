@@ -1,8 +1,17 @@
 """
 SDK Integration Helpers — FastAPI routers and bot starters.
+
+Names resolve lazily (PEP 562): fastapi/httpx are only imported
+when the matching helper is first accessed.
 """
 
-from agno_single_agent_framework.integrations.webhook import create_webhook_router
-from agno_single_agent_framework.integrations.whatsapp import create_whatsapp_router
+from agno_single_agent_framework._lazy import make_getattr
+
+_LAZY = {
+    "create_webhook_router":  "agno_single_agent_framework.integrations.webhook",
+    "create_whatsapp_router": "agno_single_agent_framework.integrations.whatsapp",
+}
 
 __all__ = ["create_webhook_router", "create_whatsapp_router"]
+
+__getattr__ = make_getattr(_LAZY, __name__)
@@ -5,6 +5,13 @@ Slack Integration — Start a Slack bot wired to any agent.
 import os
 import logging
 
+try:
+    from slack_bolt import App as _SlackApp
+    from slack_bolt.adapter.socket_mode import SocketModeHandler as _SocketModeHandler
+except ImportError:
+    _SlackApp = None
+    _SocketModeHandler = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,13 +24,10 @@ def create_slack_bot(agent):
         bot = create_slack_bot(my_agent)
         bot.start()  # Starts Socket Mode
     """
-    try:
-        from slack_bolt import App
-        from slack_bolt.adapter.socket_mode import SocketModeHandler
-    except ImportError:
+    if _SlackApp is None:
         raise ImportError("slack_bolt not installed. Run: pip install slack_bolt")
 
-    app = App(
+    app = _SlackApp(
         token=os.getenv("SLACK_BOT_TOKEN"),
         signing_secret=os.getenv("SLACK_SIGNING_SECRET"),
     )
@@ -61,7 +65,7 @@ def create_slack_bot(agent):
             token = os.getenv("SLACK_APP_TOKEN")
             if not token:
                 raise ValueError("SLACK_APP_TOKEN not set for Socket Mode")
-            handler = SocketModeHandler(app, token)
+            handler = _SocketModeHandler(app, token)
             logger.info("⚡ Slack bot started in Socket Mode")
             handler.start()
 
@@ -49,7 +49,7 @@ def create_webhook_router(agent, prefix: str = "/webhook") -> APIRouter:
         body = await request.json()
         payload = WebhookPayload(**body)
 
-        response = agent.handle_request({
+        response = await agent.ahandle_request({
             "input": payload.input,
             "request_id": payload.request_id or f"wh-{id(request)}",
             "session_id": payload.session_id,
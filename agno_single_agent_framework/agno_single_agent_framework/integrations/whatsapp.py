@@ -48,7 +48,7 @@ def create_whatsapp_router(agent, prefix: str = "/webhook/whatsapp") -> APIRoute
                 return {"status": "ok"}
 
             user_input = msg.get("text", {}).get("body", "")
-            response = agent.handle_request({
+            response = await agent.ahandle_request({
                 "input": user_input, "request_id": f"wa-{msg.get('id', '')}",
                 "session_id": f"wa-{sender}", "metadata": {"source": "whatsapp", "sender": sender},
             })
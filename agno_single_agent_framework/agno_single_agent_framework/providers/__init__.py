@@ -1,4 +1,17 @@
-from agno_single_agent_framework.providers.base_provider import BaseLLMProvider, LLMResponse
-from agno_single_agent_framework.providers.llm_client import LLMClient, create_provider
+"""
+LLM providers — public names resolve lazily (PEP 562) so importing the package
+doesn't pull in every provider SDK up front.
+"""
+
+from agno_single_agent_framework._lazy import make_getattr
+
+_LAZY = {
+    "BaseLLMProvider": "agno_single_agent_framework.providers.base_provider",
+    "LLMResponse":     "agno_single_agent_framework.providers.base_provider",
+    "LLMClient":       "agno_single_agent_framework.providers.llm_client",
+    "create_provider": "agno_single_agent_framework.providers.llm_client",
+}
 
 __all__ = ["BaseLLMProvider", "LLMResponse", "LLMClient", "create_provider"]
+
+__getattr__ = make_getattr(_LAZY, __name__)
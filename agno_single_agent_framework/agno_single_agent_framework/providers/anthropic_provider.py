@@ -1,5 +1,6 @@
 """Anthropic Claude LLM Provider."""
 
+import functools
 from typing import List, Dict
 from agno_single_agent_framework.providers.base_provider import BaseLLMProvider, LLMResponse
 
@@ -15,27 +16,39 @@ ANTHROPIC_PRICING = {
 }
 
 
+@functools.lru_cache(maxsize=16)
+def _shared_client(api_key: str):
+    # One SDK client (and so one keep-alive connection pool) per key, shared by
+    # every provider instance instead of a fresh TLS handshake per agent
+    return anthropic.Anthropic(api_key=api_key)
+
+
 class AnthropicProvider(BaseLLMProvider):
     def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514", **kwargs):
         super().__init__(model=model, **kwargs)
         if anthropic is None:
             raise ImportError("anthropic not installed. Run: pip install anthropic")
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.client = _shared_client(api_key)
 
     def generate(self, messages: List[Dict[str, str]], **kwargs) -> LLMResponse:
         try:
-            system_msg = ""
+            # Every system message becomes its own block; the first (the agent's
+            # fixed system prompt) is a prompt-cache breakpoint, so the shared
+            # prefix is served from Anthropic's cache on later requests.
+            system_blocks = []
             chat_messages = []
             for msg in messages:
                 if msg["role"] == "system":
-                    system_msg = msg["content"]
+                    system_blocks.append({"type": "text", "text": msg["content"]})
                 else:
                     chat_messages.append(msg)
+            if system_blocks:
+                system_blocks[0]["cache_control"] = {"type": "ephemeral"}
 
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=kwargs.get("max_tokens", self.max_tokens),
-                system=system_msg if system_msg else anthropic.NOT_GIVEN,
+                system=system_blocks if system_blocks else anthropic.NOT_GIVEN,
                 messages=chat_messages,
                 temperature=kwargs.get("temperature", self.temperature),
             )
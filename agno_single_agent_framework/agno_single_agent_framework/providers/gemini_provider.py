@@ -28,17 +28,17 @@ class GeminiProvider(BaseLLMProvider):
     def generate(self, messages: List[Dict[str, str]], **kwargs) -> LLMResponse:
         try:
             gemini_msgs = []
-            system_instruction = None
+            system_parts = []
             for msg in messages:
                 if msg["role"] == "system":
-                    system_instruction = msg["content"]
+                    system_parts.append(msg["content"])
                 elif msg["role"] == "user":
                     gemini_msgs.append({"role": "user", "parts": [msg["content"]]})
                 elif msg["role"] == "assistant":
                     gemini_msgs.append({"role": "model", "parts": [msg["content"]]})
 
-            if system_instruction:
-                self.client = genai.GenerativeModel(self.model, system_instruction=system_instruction)
+            if system_parts:
+                self.client = genai.GenerativeModel(self.model, system_instruction="\n\n".join(system_parts))
 
             response = self.client.generate_content(
                 gemini_msgs,
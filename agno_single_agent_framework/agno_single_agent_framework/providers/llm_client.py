@@ -3,19 +3,41 @@ LLM Client — Unified interface with provider factory.
 """
 
 import os
+import functools
+import importlib
 import yaml
 from typing import Optional, List, Dict
 from agno_single_agent_framework.providers.base_provider import BaseLLMProvider, LLMResponse
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+@functools.lru_cache(maxsize=32)
+def _load_provider_cached(spec_path: str, mtime_ns: int) -> dict:
+    """Parse the llm_provider section. mtime is part of the key so edits are picked up."""
+    with open(spec_path, "rb") as f:  # libyaml decodes UTF-8 itself
+        return yaml.load(f, Loader=_Loader).get("llm_provider", {})
+
 
 def _load_provider_from_spec(spec_path: str = "agent_spec.yaml") -> dict:
     try:
-        with open(spec_path, "r") as f:
-            return yaml.safe_load(f).get("llm_provider", {})
+        spec_path = os.path.abspath(spec_path)
+        return dict(_load_provider_cached(spec_path, os.stat(spec_path).st_mtime_ns))
     except FileNotFoundError:
         return {}
 
 
+# provider name -> (API key env var, module path, class name)
+_PROVIDERS = {
+    "openai":    ("OPENAI_API_KEY",    "agno_single_agent_framework.providers.openai_provider",    "OpenAIProvider"),
+    "gemini":    ("GEMINI_API_KEY",    "agno_single_agent_framework.providers.gemini_provider",    "GeminiProvider"),
+    "anthropic": ("ANTHROPIC_API_KEY", "agno_single_agent_framework.providers.anthropic_provider", "AnthropicProvider"),
+}
+
+
 def create_provider(
     provider_name: Optional[str] = None,
     model: Optional[str] = None,
@@ -34,29 +56,18 @@ def create_provider(
     temp = kwargs.pop("temperature", spec.get("temperature", 0.7))
     max_tok = kwargs.pop("max_tokens", spec.get("max_tokens", 500))
 
-    if name == "openai":
-        key = api_key or os.getenv("OPENAI_API_KEY")
-        if not key:
-            raise ValueError("OPENAI_API_KEY not set")
-        from agno_single_agent_framework.providers.openai_provider import OpenAIProvider
-        return OpenAIProvider(api_key=key, model=mdl, temperature=temp, max_tokens=max_tok)
-
-    elif name == "gemini":
-        key = api_key or os.getenv("GEMINI_API_KEY")
-        if not key:
-            raise ValueError("GEMINI_API_KEY not set")
-        from agno_single_agent_framework.providers.gemini_provider import GeminiProvider
-        return GeminiProvider(api_key=key, model=mdl, temperature=temp, max_tokens=max_tok)
-
-    elif name == "anthropic":
-        key = api_key or os.getenv("ANTHROPIC_API_KEY")
-        if not key:
-            raise ValueError("ANTHROPIC_API_KEY not set")
-        from agno_single_agent_framework.providers.anthropic_provider import AnthropicProvider
-        return AnthropicProvider(api_key=key, model=mdl, temperature=temp, max_tokens=max_tok)
-
-    else:
-        raise ValueError(f"Unsupported LLM provider: {name}. Supported: openai, gemini, anthropic")
+    try:
+        env_key, module_path, class_name = _PROVIDERS[name]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"Unsupported LLM provider: {name}. Supported: {', '.join(_PROVIDERS)}"
+        ) from None
+
+    key = api_key or os.getenv(env_key)
+    if not key:
+        raise ValueError(f"{env_key} not set")
+    provider_cls = getattr(importlib.import_module(module_path), class_name)
+    return provider_cls(api_key=key, model=mdl, temperature=temp, max_tokens=max_tok)
 
 
 class LLMClient:
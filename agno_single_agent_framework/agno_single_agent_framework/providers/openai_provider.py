@@ -1,5 +1,6 @@
 """OpenAI LLM Provider."""
 
+import functools
 from typing import List, Dict
 from agno_single_agent_framework.providers.base_provider import BaseLLMProvider, LLMResponse
 
@@ -18,12 +19,23 @@ OPENAI_PRICING = {
 }
 
 
+@functools.lru_cache(maxsize=16)
+def _shared_client(api_key: str):
+    # One SDK client (and so one keep-alive connection pool) per key, shared by
+    # every provider instance instead of a fresh TLS handshake per agent
+    return openai.OpenAI(api_key=api_key)
+
+
 class OpenAIProvider(BaseLLMProvider):
     def __init__(self, api_key: str, model: str = "gpt-4o-mini", **kwargs):
         super().__init__(model=model, **kwargs)
         if openai is None:
             raise ImportError("openai package not installed. Run: pip install openai")
-        self.client = openai.OpenAI(api_key=api_key)
+        self.client = _shared_client(api_key)
+        # Model is fixed per instance — resolve per-token rates once, not per call
+        p = OPENAI_PRICING.get(model, {"input": 0, "output": 0})
+        self._price_in = p["input"] / 1000
+        self._price_out = p["output"] / 1000
 
     def generate(self, messages: List[Dict[str, str]], **kwargs) -> LLMResponse:
         try:
@@ -46,5 +58,4 @@ class OpenAIProvider(BaseLLMProvider):
         return "openai"
 
     def estimate_cost(self, tokens_input: int, tokens_output: int) -> float:
-        p = OPENAI_PRICING.get(self.model, {"input": 0, "output": 0})
-        return (tokens_input / 1000 * p["input"]) + (tokens_output / 1000 * p["output"])
+        return tokens_input * self._price_in + tokens_output * self._price_out
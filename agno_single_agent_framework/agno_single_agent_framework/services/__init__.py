@@ -1,9 +1,24 @@
-from agno_single_agent_framework.services.observability import StructuredLogger, new_trace, new_span, track_latency
-from agno_single_agent_framework.services.guardrails import Guardrails
-from agno_single_agent_framework.services.logging import setup_logging, get_logger, LogContext
+"""
+Services — guardrails, observability and logging. Names resolve lazily (PEP 562).
+"""
+
+from agno_single_agent_framework._lazy import make_getattr
+
+_LAZY = {
+    "StructuredLogger": "agno_single_agent_framework.services.observability",
+    "new_trace":        "agno_single_agent_framework.services.observability",
+    "new_span":         "agno_single_agent_framework.services.observability",
+    "track_latency":    "agno_single_agent_framework.services.observability",
+    "Guardrails":       "agno_single_agent_framework.services.guardrails",
+    "setup_logging":    "agno_single_agent_framework.services.logging",
+    "get_logger":       "agno_single_agent_framework.services.logging",
+    "LogContext":       "agno_single_agent_framework.services.logging",
+}
 
 __all__ = [
     "StructuredLogger", "Guardrails",
     "new_trace", "new_span", "track_latency",
     "setup_logging", "get_logger", "LogContext",
 ]
+
+__getattr__ = make_getattr(_LAZY, __name__)
@@ -21,6 +21,7 @@ Errors raised by guardrails:
     from agno.exceptions import InputCheckError, OutputCheckError
 """
 
+import re
 import logging
 from typing import List, Tuple
 
@@ -37,6 +38,55 @@ except ImportError:
     )
 
 
+def _combine(patterns):
+    """
+    One alternation over all patterns, so clean text is rejected in a single scan.
+    None when the patterns can't be combined (differing flags, clashing groups).
+    """
+    flags = {p.flags for p in patterns}
+    if len(flags) != 1:
+        return None
+    # Stdlib re with the same flags, so the alternation matches exactly what
+    # the separate patterns do (another engine could differ, e.g. on \d)
+    combined = "|".join(f"(?:{p.pattern})" for p in patterns)
+    try:
+        return re.compile(combined, flags.pop())
+    except re.error:   # e.g. a repeated group name across patterns
+        return None
+
+
+if _GUARDRAILS_AVAILABLE:
+    class _PrescreenedPIIGuardrail(PIIDetectionGuardrail):
+        """
+        PIIDetectionGuardrail with a single-pass pre-screen.
+
+        Most inputs contain no PII; those are cleared by one combined regex
+        instead of one scan per pattern. Anything that matches goes through
+        the stock check unchanged, so detection and masking are Agno's own.
+        """
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            patterns = list(getattr(self, "pii_patterns", {}).values())
+            self._prescreen = _combine(patterns) if patterns else None
+
+        def _clean(self, run_input) -> bool:
+            content = getattr(run_input, "input_content_string", None)
+            if self._prescreen is None or not callable(content):
+                return False
+            return self._prescreen.search(content()) is None
+
+        def check(self, run_input):
+            if self._clean(run_input):
+                return None
+            return super().check(run_input)
+
+        async def async_check(self, run_input):
+            if self._clean(run_input):
+                return None
+            return await super().async_check(run_input)
+
+
 def build_guardrail_hooks(
     pii_filter: bool = True,
     injection_detection: bool = True,
@@ -66,8 +116,10 @@ def build_guardrail_hooks(
         logger.debug("Guardrail: PromptInjectionGuardrail added to pre_hooks")
 
     if pii_filter:
-        pre_hooks.append(PIIDetectionGuardrail(mask_pii=mask_pii))
-        post_hooks.append(PIIDetectionGuardrail(mask_pii=mask_pii))
+        # The guardrail keeps no per-run state — one instance serves both hook lists
+        pii = _PrescreenedPIIGuardrail(mask_pii=mask_pii)
+        pre_hooks.append(pii)
+        post_hooks.append(pii)
         logger.debug("Guardrail: PIIDetectionGuardrail added to pre_hooks + post_hooks (mask_pii=%s)", mask_pii)
 
     return pre_hooks, post_hooks
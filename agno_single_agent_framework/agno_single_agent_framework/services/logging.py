@@ -15,41 +15,87 @@ import os
 import sys
 import json
 import time
+import queue
+import atexit
+import contextlib
 import logging
 import logging.handlers
-from typing import Optional
+import threading
+from typing import Dict, Optional, Tuple
 from contextvars import ContextVar
 
 from agno.utils.log import configure_agno_logging
 
-# Context variables for request-scoped correlation IDs
-_request_id: ContextVar[str] = ContextVar("log_request_id", default="")
-_session_id: ContextVar[str] = ContextVar("log_session_id", default="")
-_agent_name: ContextVar[str] = ContextVar("log_agent_name", default="agent")
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON encoder bound once at import — orjson (C) when installed, stdlib otherwise
+if orjson is not None:
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, default=str).decode()
+else:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, default=str)
+
+# Request-scoped correlation context: (agent_name, request_id, session_id).
+# One ContextVar holding a tuple — a single set() per request instead of three.
+_log_context: ContextVar[Tuple[str, str, str]] = ContextVar("log_context", default=("agent", "", ""))
+
+# Bound once so the formatters don't repeat the global + attribute lookups per record
+_get_log_context = _log_context.get
+
+
+def _record_context(record: logging.LogRecord) -> Tuple[str, str, str]:
+    """Context captured when the record was queued, else the current one (direct handler use)."""
+    return getattr(record, "log_context", None) or _get_log_context()
+
+
+# Per-thread dicts reused by JSONFormatter — the entry is serialized before
+# format() returns, so each thread can refill the same dict for every record.
+_scratch = threading.local()
 
 
 class JSONFormatter(logging.Formatter):
     """Emits structured JSON log lines with agent + request context."""
 
+    # ISO-8601 UTC with milliseconds, filled from struct_time fields (no strftime)
+    _TIMESTAMP_FMT = "%04d-%02d-%02dT%02d:%02d:%02d.%03dZ"
+
     def format(self, record: logging.LogRecord) -> str:
-        log_entry = {
-            "timestamp": (
-                time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
-                + f".{int(record.msecs):03d}Z"
-            ),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-            "agent": _agent_name.get("agent"),
-            "request_id": _request_id.get(""),
-            "session_id": _session_id.get(""),
-        }
-        if record.exc_info and record.exc_info[0]:
-            log_entry["exception"] = {
-                "type": record.exc_info[0].__name__,
-                "message": str(record.exc_info[1]),
-            }
-        return json.dumps(log_entry, default=str)
+        t = time.gmtime(record.created)
+        agent_name, request_id, session_id = _record_context(record)
+        timestamp = self._TIMESTAMP_FMT % (
+            t.tm_year, t.tm_mon, t.tm_mday,
+            t.tm_hour, t.tm_min, t.tm_sec, int(record.msecs),
+        )
+        # Evaluated before touching the scratch dict: getMessage()/str() can log
+        # re-entrantly on this thread.
+        message = record.getMessage()
+        exc_info = record.exc_info
+        exc_message = str(exc_info[1]) if exc_info and exc_info[0] else None
+
+        scratch = _scratch.__dict__
+        log_entry = scratch.get("entry")
+        if log_entry is None:
+            log_entry = scratch["entry"] = {}
+            scratch["exception"] = {}
+        log_entry["timestamp"] = timestamp
+        log_entry["level"] = record.levelname
+        log_entry["logger"] = record.name
+        log_entry["message"] = message
+        log_entry["agent"] = agent_name
+        log_entry["request_id"] = request_id
+        log_entry["session_id"] = session_id
+        if exc_message is not None:
+            exception = scratch["exception"]
+            exception["type"] = exc_info[0].__name__
+            exception["message"] = exc_message
+            log_entry["exception"] = exception
+        else:
+            log_entry.pop("exception", None)
+        return _dumps(log_entry)
 
 
 class PrettyFormatter(logging.Formatter):
@@ -64,16 +110,80 @@ class PrettyFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    # Colored, padded level column rendered once per level instead of per record
+    _LEVEL_PREFIX = {lvl: f"{color}{lvl:8}\033[0m " for lvl, color in COLORS.items()}
+    _NAME_OPEN = "\033[90m"
+    _NAME_CLOSE = "\033[0m — "
+
     def format(self, record: logging.LogRecord) -> str:
-        color = self.COLORS.get(record.levelname, "")
-        req_id = _request_id.get("")
-        prefix = f"[{req_id[:8]}] " if req_id else ""
-        return (
-            f"{color}{record.levelname:8}{self.RESET} "
-            f"{prefix}"
-            f"\033[90m{record.name}\033[0m — "
-            f"{record.getMessage()}"
-        )
+        level = self._LEVEL_PREFIX.get(record.levelname)
+        if level is None:   # custom level names
+            level = f"{record.levelname:8}{self.RESET} "
+        req_id = _record_context(record)[1]
+        if req_id:
+            level += "[" + req_id[:8] + "] "
+        return level + self._NAME_OPEN + record.name + self._NAME_CLOSE + record.getMessage()
+
+
+class _ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for an in-process queue. Formatting happens later on the
+    listener thread, so the request context is captured here, at enqueue time.
+    Unlike the base class it keeps exc_info — JSONFormatter reads it, and the
+    record never leaves the process.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)   # don't mutate the caller's record
+        record.msg = record.message = record.getMessage()   # freeze mutable args now
+        record.args = None
+        record.log_context = _get_log_context()
+        return record
+
+
+# Third-party loggers capped at WARNING by the first setup_logging call
+_NOISY_LIBS = ("urllib3", "httpx", "httpcore", "openai", "google", "anthropic")
+_libs_muted = False
+
+# One listener thread per handler configuration, shared by every agent logger
+# that uses it: (log_format, log_file, max_bytes, backup_count) → (listener, queue handler)
+_listeners: Dict[tuple, Tuple[logging.handlers.QueueListener, logging.Handler]] = {}
+# Agent logger name → the configuration it is attached to
+_agent_configs: Dict[str, tuple] = {}
+_listeners_lock = threading.Lock()
+
+
+def _stop_listener(config: tuple):
+    listener, _ = _listeners.pop(config)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@atexit.register
+def _stop_listeners():
+    """Flush queued records to their handlers on interpreter exit."""
+    with _listeners_lock:
+        for config in list(_listeners):
+            _stop_listener(config)
+        _agent_configs.clear()
+
+
+def _queue_handler(agent_name: str, config: tuple, build_handlers) -> logging.Handler:
+    """The queue handler for `config`, starting its listener on first use."""
+    with _listeners_lock:
+        previous = _agent_configs.get(agent_name)
+        _agent_configs[agent_name] = config
+        if previous is not None and previous != config and previous not in _agent_configs.values():
+            _stop_listener(previous)   # last agent using the old configuration moved off it
+
+        entry = _listeners.get(config)
+        if entry is None:
+            log_queue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(log_queue, *build_handlers(), respect_handler_level=True)
+            listener.start()
+            entry = _listeners[config] = (listener, _ContextQueueHandler(log_queue))
+        return entry[1]
 
 
 def setup_logging(
@@ -96,52 +206,65 @@ def setup_logging(
         max_bytes:    Max log file size before rotation.
         backup_count: Number of rotated files to keep.
     """
-    _agent_name.set(agent_name)
+    _, request_id, session_id = _get_log_context()
+    _log_context.set((agent_name, request_id, session_id))
 
     logger = logging.getLogger(agent_name)
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
     logger.handlers.clear()
     logger.propagate = False
 
-    formatter = JSONFormatter() if log_format == "json" else PrettyFormatter()
+    def build_handlers():
+        formatter = JSONFormatter() if log_format == "json" else PrettyFormatter()
 
-    console = logging.StreamHandler(sys.stdout)
-    console.setFormatter(formatter)
-    logger.addHandler(console)
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(formatter)
+        handlers = [console]
 
-    if log_file:
-        os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
-        fh = logging.handlers.RotatingFileHandler(
-            log_file, maxBytes=max_bytes, backupCount=backup_count
-        )
-        fh.setFormatter(JSONFormatter())   # always JSON in files
-        logger.addHandler(fh)
+        if log_file:
+            os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+            fh = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=max_bytes, backupCount=backup_count
+            )
+            fh.setFormatter(JSONFormatter())   # always JSON in files
+            handlers.append(fh)
+        return handlers
+
+    # Callers only enqueue; a listener thread formats and does the stream/file I/O.
+    # Agents with the same handler configuration share that thread and handlers.
+    config = (log_format, os.path.abspath(log_file) if log_file else None, max_bytes, backup_count)
+    logger.addHandler(_queue_handler(agent_name, config, build_handlers))
 
     # Wire Agno's internal agent logger to the same handler
     configure_agno_logging(custom_agent_logger=logger)
 
-    # Suppress noise from third-party libraries
-    for lib in ["urllib3", "httpx", "httpcore", "openai", "google", "anthropic"]:
-        logging.getLogger(lib).setLevel(logging.WARNING)
+    # Suppress noise from third-party libraries (once per process)
+    global _libs_muted
+    if not _libs_muted:
+        for lib in _NOISY_LIBS:
+            logging.getLogger(lib).setLevel(logging.WARNING)
+        _libs_muted = True
 
     logger.info(
-        f"Logging initialized — level={level}, format={log_format}, file={log_file or 'none'}"
+        "Logging initialized — level=%s, format=%s, file=%s",
+        level, log_format, log_file or "none",
     )
     return logger
 
 
 def set_request_context(request_id: str = "", session_id: str = ""):
     """Set request-scoped correlation IDs injected into every log line."""
-    if request_id:
-        _request_id.set(request_id)
-    if session_id:
-        _session_id.set(session_id)
+    agent_name, current_request_id, current_session_id = _get_log_context()
+    _log_context.set((
+        agent_name,
+        request_id or current_request_id,
+        session_id or current_session_id,
+    ))
 
 
 def clear_request_context():
     """Clear request context after handling."""
-    _request_id.set("")
-    _session_id.set("")
+    _log_context.set((_get_log_context()[0], "", ""))
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -149,7 +272,8 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
-class LogContext:
+@contextlib.contextmanager
+def LogContext(request_id: str = "", session_id: str = ""):
     """
     Context manager for request-scoped logging correlation.
 
@@ -157,15 +281,17 @@ class LogContext:
         with LogContext(request_id="req-123", session_id="sess-456"):
             logger.info("Processing request")
             # All logs within this block carry request_id + session_id
-    """
-
-    def __init__(self, request_id: str = "", session_id: str = ""):
-        self.request_id = request_id
-        self.session_id = session_id
 
-    def __enter__(self):
-        set_request_context(self.request_id, self.session_id)
-        return self
-
-    def __exit__(self, *args):
-        clear_request_context()
+    On exit the previous context is restored via the ContextVar token, so
+    nested blocks unwind correctly.
+    """
+    agent_name, current_request_id, current_session_id = _get_log_context()
+    token = _log_context.set((
+        agent_name,
+        request_id or current_request_id,
+        session_id or current_session_id,
+    ))
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
@@ -18,7 +18,7 @@ OTel backends supported (all use AgnoInstrumentor):
     Install: pip install openinference-instrumentation-agno opentelemetry-sdk opentelemetry-exporter-otlp
 """
 
-import uuid
+import os
 import logging
 from contextvars import ContextVar
 from typing import Optional, Dict, Any
@@ -27,10 +27,22 @@ logger = logging.getLogger(__name__)
 
 trace_id_var: ContextVar[str] = ContextVar("trace_id", default="")
 
+# Token fields use %s, not %d — Agno can report None for providers without usage
+_METRICS_FMT = (
+    "Run metrics — status=%s | request_id=%s | latency=%.0fms"
+    " | tokens_in=%s | tokens_out=%s | trace_id=%s"
+)
+_METRICS_FMT_ERR = _METRICS_FMT + " | error=%s"
+
 
 def new_trace() -> str:
     """Generate a new correlation trace ID and store in context."""
-    tid = str(uuid.uuid4())
+    # Same canonical UUID4 string as str(uuid.uuid4()) without building a UUID object
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40   # version 4
+    b[8] = (b[8] & 0x3F) | 0x80   # RFC 4122 variant
+    h = b.hex()
+    tid = f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
     trace_id_var.set(tid)
     return tid
 
@@ -53,29 +65,37 @@ def log_run_metrics(
                    time_to_first_token, cache_read_tokens, cache_write_tokens
     """
     metrics: Dict = {}
-    if hasattr(run_response, "metrics") and run_response.metrics:
+    run_metrics = getattr(run_response, "metrics", None)
+    if run_metrics is not None:
         try:
-            metrics = run_response.metrics.to_dict()
-        except Exception:
-            pass
-
-    parts = [
-        f"status={status}",
-        f"request_id={request_id}",
-        f"latency={latency_ms:.0f}ms",
-        f"tokens_in={metrics.get('input_tokens', 0)}",
-        f"tokens_out={metrics.get('output_tokens', 0)}",
-        f"trace_id={trace_id_var.get('')}",
-    ]
+            metrics = run_metrics.to_dict()
+        except Exception as e:   # a bad metrics object must not fail the request
+            logger.debug("Could not read run metrics: %s", e)
+
+    # Metrics are always collected (callers report token counts from the return
+    # value); only the log line is skipped when its level is disabled.
+    level = logging.ERROR if status == "fail" else logging.INFO
+    if not agent_logger.isEnabledFor(level):
+        return metrics
+
+    # %-style args: the line is only rendered if a handler actually emits it
+    tokens_in = metrics.get("input_tokens", 0)
+    tokens_out = metrics.get("output_tokens", 0)
+    trace_id = trace_id_var.get("")
     if error:
-        parts.append(f"error={error}")
-
-    log_fn = agent_logger.error if status == "fail" else agent_logger.info
-    log_fn("Run metrics — " + " | ".join(parts))
+        agent_logger.log(level, _METRICS_FMT_ERR, status, request_id, latency_ms,
+                         tokens_in, tokens_out, trace_id, error)
+    else:
+        agent_logger.log(level, _METRICS_FMT, status, request_id, latency_ms,
+                         tokens_in, tokens_out, trace_id)
 
     return metrics
 
 
+# Set once setup_otel has installed tracing; later calls are no-ops
+_otel_initialized = False
+
+
 def setup_otel(
     service_name: str = "agno-agent",
     otlp_endpoint: Optional[str] = None,
@@ -93,7 +113,7 @@ def setup_otel(
         otlp_headers:   Auth headers, e.g. {"signoz-ingestion-key": "..."}.
 
     Returns:
-        True if OTel was set up successfully, False if dependencies are missing.
+        True if OTel was set up successfully (or already was), False if dependencies are missing.
 
     Install:
         pip install openinference-instrumentation-agno \\
@@ -120,6 +140,18 @@ def setup_otel(
         from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
         from opentelemetry import trace
 
+        global _otel_initialized
+        if _otel_initialized:
+            return True
+
+        # An SDK provider installed elsewhere can't be replaced (OTel refuses the
+        # override) — a second one would only leak its exporter thread. Reuse it.
+        if isinstance(trace.get_tracer_provider(), TracerProvider):
+            AgnoInstrumentor().instrument()
+            _otel_initialized = True
+            logger.info("OTel tracing enabled — reusing the existing tracer provider")
+            return True
+
         resource = Resource.create({"service.name": service_name})
         provider = TracerProvider(resource=resource)
 
@@ -135,17 +167,19 @@ def setup_otel(
         provider.add_span_processor(BatchSpanProcessor(exporter))
         trace.set_tracer_provider(provider)
         AgnoInstrumentor().instrument()
+        _otel_initialized = True
 
         logger.info(
-            f"OTel tracing enabled — service={service_name}, "
-            f"endpoint={otlp_endpoint or 'console'}"
+            "OTel tracing enabled — service=%s, endpoint=%s",
+            service_name, otlp_endpoint or "console",
         )
         return True
 
     except ImportError as e:
         logger.warning(
-            f"OTel setup skipped — missing dependencies ({e}). "
+            "OTel setup skipped — missing dependencies (%s). "
             "Install: pip install openinference-instrumentation-agno "
-            "opentelemetry-sdk opentelemetry-exporter-otlp"
+            "opentelemetry-sdk opentelemetry-exporter-otlp",
+            e,
         )
         return False
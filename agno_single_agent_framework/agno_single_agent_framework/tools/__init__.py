@@ -3,23 +3,32 @@ Tools for the Agno Single Agent Framework.
 
 All tools are available as both Agno Toolkits (recommended) and
 legacy module-style for backward compatibility.
+
+Names resolve lazily (PEP 562) — a toolkit's module and its third-party
+dependencies are only imported when that toolkit is first accessed.
 """
 
-# Agno Toolkits (recommended)
-from agno_single_agent_framework.tools.calculator import CalculatorToolkit
-from agno_single_agent_framework.tools.web_search import WebSearchToolkit
-from agno_single_agent_framework.tools.http_request import HTTPRequestToolkit
-from agno_single_agent_framework.tools.email_sender import EmailSenderToolkit
-from agno_single_agent_framework.tools.file_parser import FileParserToolkit
-from agno_single_agent_framework.tools.database_lookup import DatabaseLookupToolkit
+import importlib
+
+# Agno Toolkits (recommended) — name -> defining module
+_LAZY_TOOLKITS = {
+    "CalculatorToolkit":     "agno_single_agent_framework.tools.calculator",
+    "WebSearchToolkit":      "agno_single_agent_framework.tools.web_search",
+    "HTTPRequestToolkit":    "agno_single_agent_framework.tools.http_request",
+    "EmailSenderToolkit":    "agno_single_agent_framework.tools.email_sender",
+    "FileParserToolkit":     "agno_single_agent_framework.tools.file_parser",
+    "DatabaseLookupToolkit": "agno_single_agent_framework.tools.database_lookup",
+}
 
 # Legacy module imports (backward compatibility)
-from agno_single_agent_framework.tools import calculator
-from agno_single_agent_framework.tools import web_search
-from agno_single_agent_framework.tools import database_lookup
-from agno_single_agent_framework.tools import http_request
-from agno_single_agent_framework.tools import email_sender
-from agno_single_agent_framework.tools import file_parser
+_LAZY_MODULES = frozenset({
+    "calculator",
+    "web_search",
+    "database_lookup",
+    "http_request",
+    "email_sender",
+    "file_parser",
+})
 
 __all__ = [
     # Agno Toolkits
@@ -37,3 +46,15 @@ __all__ = [
     "email_sender",
     "file_parser",
 ]
+
+
+def __getattr__(name):
+    module_path = _LAZY_TOOLKITS.get(name)
+    if module_path is not None:
+        value = getattr(importlib.import_module(module_path), name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
@@ -0,0 +1,109 @@
+"""
+Small in-process caches shared by the toolkits.
+"""
+
+import json
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any
+
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class SQLiteCache:
+    """
+    Persistent cache with the same get/set/clear API as TTLCache.
+
+    Keys are short fixed-size digests stored as BLOB primary keys — lookups are
+    an indexed compare on 16 bytes rather than on the full prompt text. Values
+    must be JSON-serializable. Expired entries are purged, and once maxsize is
+    exceeded the oldest entries go.
+    """
+
+    _EVICT_EVERY = 256   # sets between size checks — COUNT(*) isn't free
+
+    def __init__(self, path: str, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._sets = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")   # WAL-safe; no fsync per insert
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, value BLOB, ts REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_ts ON cache(ts)")
+
+    def get(self, key: bytes):
+        with self._lock:
+            row = self._conn.execute("SELECT value, ts FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, ts = row
+            if ts + self._ttl < time.time():   # wall clock: entries outlive the process
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+        return json.loads(value)
+
+    def set(self, key: bytes, value):
+        raw = json.dumps(value, separators=(",", ":")).encode()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+                (key, raw, time.time()),   # sub-second, so insertion order survives ties
+            )
+            self._sets += 1
+            if self._sets % self._EVICT_EVERY == 0:
+                self._evict()
+
+    def _evict(self):
+        # Expired rows first — otherwise they'd linger until their own key is read
+        self._conn.execute("DELETE FROM cache WHERE ts < ?", (time.time() - self._ttl,))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+        if count > self._maxsize:
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY ts, rowid LIMIT ?)",
+                (count - self._maxsize,),
+            )
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,26 @@
+"""
+Shared HTTP clients for the toolkits.
+"""
+
+import asyncio
+import weakref
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# One AsyncClient per event loop — httpx connections are bound to the loop
+# that opened them, so a single module-wide client can't be shared safely.
+_async_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def get_async_client():
+    """Pooled httpx.AsyncClient for the running event loop (httpx must be installed)."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+    return client
@@ -1,12 +1,30 @@
 """
 Calculator Toolkit — Basic arithmetic operations using Agno framework.
 
-Provides add, subtract, multiply, and divide operations as Agno tools.
+Provides add, subtract, multiply, and divide operations as Agno tools,
+plus an element-wise batch operation over lists of numbers.
 """
 
+import functools
+import operator
+from typing import List
+
 from agno.tools import Toolkit
 
 
+def _divide_or_none(x: float, y: float):
+    """Batch division: a zero divisor yields None at that position instead of raising."""
+    return x / y if y != 0 else None
+
+
+_BATCH_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": _divide_or_none,
+}
+
+
 class CalculatorToolkit(Toolkit):
     """Toolkit for performing basic arithmetic operations."""
 
@@ -16,6 +34,7 @@ class CalculatorToolkit(Toolkit):
         self.register(self.subtract)
         self.register(self.multiply)
         self.register(self.divide)
+        self.register(self.batch)
 
     def add(self, a: float, b: float) -> dict:
         """
@@ -76,6 +95,28 @@ class CalculatorToolkit(Toolkit):
         result = a / b
         return {"result": result, "expression": f"{a} ÷ {b} = {result}"}
 
+    def batch(self, operation: str, a: List[float], b: List[float]) -> dict:
+        """
+        Apply one operation element-wise to two equal-length lists of numbers.
+        Use this instead of many single calls when working over several values.
+
+        Args:
+            operation: One of add, subtract, multiply, divide
+            a: The left-hand operands
+            b: The right-hand operands (same length as a)
+
+        Returns:
+            A dictionary with the list of results; division by zero yields null at that position
+        """
+        op = _BATCH_OPS.get(operation)
+        if op is None:
+            return {"error": f"Unknown operation: {operation}"}
+        if len(a) != len(b):
+            return {"error": f"Length mismatch: {len(a)} vs {len(b)}"}
+
+        results = list(map(op, a, b))
+        return {"result": results, "operation": operation, "count": len(results)}
+
 
 # Backward compatibility: Keep the old interface
 DESCRIPTION = "Perform basic arithmetic: add, subtract, multiply, divide."
@@ -86,17 +127,21 @@ PARAMETERS = {
 }
 
 
-def run(operation: str, a: float, b: float) -> dict:
-    """Execute a calculation (legacy interface for backward compatibility)."""
+@functools.lru_cache(maxsize=None)
+def _legacy_ops() -> dict:
+    """Operation table for run(), backed by one shared toolkit built on first use."""
     toolkit = CalculatorToolkit()
-    ops = {
+    return {
         "add": toolkit.add,
         "subtract": toolkit.subtract,
         "multiply": toolkit.multiply,
         "divide": toolkit.divide,
     }
 
-    if operation not in ops:
-        return {"error": f"Unknown operation: {operation}"}
 
-    return ops[operation](a, b)
+def run(operation: str, a: float, b: float) -> dict:
+    """Execute a calculation (legacy interface for backward compatibility)."""
+    fn = _legacy_ops().get(operation)
+    if fn is None:
+        return {"error": f"Unknown operation: {operation}"}
+    return fn(a, b)
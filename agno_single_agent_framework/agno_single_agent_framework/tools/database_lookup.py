@@ -10,26 +10,158 @@ Setup:
 """
 
 import os
+import re
+import copy
+import queue
 import logging
+import threading
+from typing import Any, Dict, Optional
 from urllib.parse import urlparse
 from agno.tools import Toolkit
 
+from agno_single_agent_framework.tools._cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 # Blocked keywords to prevent destructive queries
 BLOCKED_KEYWORDS = ["INSERT", "UPDATE", "DELETE", "DROP", "ALTER", "CREATE", "TRUNCATE", "GRANT", "REVOKE"]
+# One case-insensitive pass; \b keeps identifiers like updated_at / created_by usable
+_BLOCKED_RE = re.compile(r"\b(?:" + "|".join(BLOCKED_KEYWORDS) + r")\b", re.IGNORECASE)
+
+_PG_DESCRIBE_SQL = (
+    "SELECT column_name, data_type, is_nullable "
+    "FROM information_schema.columns "
+    "WHERE table_name = %s AND table_schema = 'public' "
+    "ORDER BY ordinal_position"
+)
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_$]*$")
+
+# Statements Postgres accepts in DECLARE ... CURSOR (server-side streaming)
+_STREAMABLE_RE = re.compile(r"\s*\(?\s*(?:SELECT|WITH|VALUES|TABLE)\b", re.IGNORECASE)
+_SERVER_CURSOR_ITERSIZE = 1000
+
+# Max open connections kept per database URL
+_POOL_MAX = 8
+
+
+# Result cache sizing — LLM agents often re-issue identical read queries
+_QUERY_CACHE_SIZE = 256
+_QUERY_CACHE_TTL = 60       # seconds
+_SCHEMA_CACHE_TTL = 600     # table lists / column info change rarely
+
+
+def _snapshot(result: dict) -> dict:
+    """Independent copy of a query result (rows as plain dicts) — cached results are never shared."""
+    return copy.deepcopy({**result, "rows": [dict(row) for row in result["rows"]]})
+
+
+def _max_rows_from_env() -> Optional[int]:
+    raw = os.getenv("DATABASE_MAX_ROWS")
+    if not raw:
+        return None
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning(f"Invalid DATABASE_MAX_ROWS={raw!r}, returning all rows")
+        return None
+
+
+class _MySQLPool:
+    """Minimal LIFO pool of pymysql connections (pymysql ships none) — same getconn/putconn API as psycopg2's."""
+
+    def __init__(self, connect, maxsize: int):
+        self._connect = connect
+        self._idle = queue.LifoQueue(maxsize)
+
+    def getconn(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+        conn.ping(reconnect=True)   # server may have dropped an idle connection
+        return conn
+
+    def putconn(self, conn, close: bool = False):
+        if not close:
+            try:
+                self._idle.put_nowait(conn)
+                return
+            except queue.Full:
+                pass
+        conn.close()
+
+
+class _BlockingPool:
+    """
+    Wraps psycopg2's ThreadedConnectionPool, whose getconn() raises PoolError
+    once maxconn connections are out — callers wait for a free one instead.
+    """
+
+    def __init__(self, pool, maxsize: int):
+        self._pool = pool
+        self._slots = threading.BoundedSemaphore(maxsize)
+
+    def getconn(self):
+        self._slots.acquire()
+        try:
+            return self._pool.getconn()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn, close: bool = False):
+        try:
+            self._pool.putconn(conn, close=close)
+        finally:
+            self._slots.release()
 
 
 class DatabaseLookupToolkit(Toolkit):
-    """Toolkit for executing read-only SQL queries on databases."""
+    """
+    Toolkit for executing read-only SQL queries on databases.
+
+    max_rows (or DATABASE_MAX_ROWS) caps the rows a query returns; it is an
+    operator setting, not something the model chooses per call.
+    """
 
-    def __init__(self, database_url: str = None):
+    # Connection pools shared by every toolkit instance, keyed by database URL
+    _pools: Dict[str, Any] = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, database_url: str = None, max_rows: Optional[int] = None):
         super().__init__(name="database_lookup")
         self._db_url = database_url or os.getenv("DATABASE_URL")
+        self._max_rows = max_rows if max_rows is not None else _max_rows_from_env()
+        self._cache = TTLCache(_QUERY_CACHE_SIZE, _QUERY_CACHE_TTL)
+        self._schema_cache = TTLCache(_QUERY_CACHE_SIZE, _SCHEMA_CACHE_TTL)
+        # Dialect fixed once from the URL scheme; queries dispatch through _querier
+        parsed = urlparse(self._db_url) if self._db_url else None
+        scheme = parsed.scheme if parsed else ""
+        if scheme.startswith("postgres"):
+            self._dialect = "postgres"
+        elif scheme.startswith(("mysql", "mariadb")):
+            self._dialect = "mysql"
+        else:
+            self._dialect = None
+        self._querier = {"postgres": self._query_postgres, "mysql": self._query_mysql}.get(self._dialect)
+        self._mysql_params = None
+        if self._dialect == "mysql":
+            self._mysql_params = {
+                "host": parsed.hostname,
+                "port": parsed.port or 3306,
+                "user": parsed.username,
+                "password": parsed.password,
+                "database": parsed.path.lstrip("/"),
+            }
         self.register(self.query)
         self.register(self.list_tables)
         self.register(self.describe_table)
 
+    def invalidate(self):
+        """Drop all cached query results and schema lookups."""
+        self._cache.clear()
+        self._schema_cache.clear()
+
     def query(self, sql: str) -> dict:
         """
         Execute a read-only SQL SELECT query and return results.
@@ -44,25 +176,37 @@ class DatabaseLookupToolkit(Toolkit):
             A dictionary with rows, row_count, and column names
         """
         # Safety: Block write operations
-        sql_upper = sql.strip().upper()
-        for kw in BLOCKED_KEYWORDS:
-            if kw in sql_upper:
-                return {"error": f"Blocked: '{kw}' operations are not allowed. Read-only queries only."}
+        blocked = _BLOCKED_RE.search(sql)
+        if blocked:
+            kw = blocked.group(0).upper()
+            return {"error": f"Blocked: '{kw}' operations are not allowed. Read-only queries only."}
 
         if not self._db_url:
             return {"error": "DATABASE_URL not set in environment."}
 
+        return self._cached_query(self._cache, sql, self._max_rows)
+
+    def _cached_query(
+        self, cache: TTLCache, sql: str, max_rows: Optional[int] = None, params: Optional[tuple] = None
+    ) -> dict:
+        """Run a vetted read-only query, serving repeats from `cache`. Errors are not cached."""
+        key = (" ".join(sql.split()), params, max_rows)   # whitespace-insensitive
+        result = cache.get(key)
+        if result is not None:
+            return _snapshot(result)
+
+        if self._querier is None:
+            return {"error": "Unsupported database type in URL."}
         try:
-            if "postgresql" in self._db_url or "postgres" in self._db_url:
-                return self._query_postgres(sql)
-            elif "mysql" in self._db_url:
-                return self._query_mysql(sql)
-            else:
-                return {"error": f"Unsupported database type in URL."}
+            result = self._querier(sql, max_rows, params)
         except Exception as e:
             logger.error(f"Database query failed: {e}")
             return {"error": str(e)}
 
+        if "error" not in result:
+            cache.set(key, _snapshot(result))
+        return result
+
     def list_tables(self) -> dict:
         """
         List all available tables in the database.
@@ -73,14 +217,14 @@ class DatabaseLookupToolkit(Toolkit):
         if not self._db_url:
             return {"error": "DATABASE_URL not set in environment."}
 
-        if "postgresql" in self._db_url or "postgres" in self._db_url:
+        if self._dialect == "postgres":
             sql = "SELECT table_name FROM information_schema.tables WHERE table_schema = 'public' ORDER BY table_name"
-        elif "mysql" in self._db_url:
+        elif self._dialect == "mysql":
             sql = "SHOW TABLES"
         else:
             return {"error": "Unsupported database type."}
 
-        result = self.query(sql)
+        result = self._cached_query(self._schema_cache, sql)
         if "error" in result:
             return result
 
@@ -100,67 +244,91 @@ class DatabaseLookupToolkit(Toolkit):
         if not self._db_url:
             return {"error": "DATABASE_URL not set in environment."}
 
-        if "postgresql" in self._db_url or "postgres" in self._db_url:
-            sql = f"""
-                SELECT column_name, data_type, is_nullable
-                FROM information_schema.columns
-                WHERE table_name = '{table_name}' AND table_schema = 'public'
-                ORDER BY ordinal_position
-            """
-        elif "mysql" in self._db_url:
-            sql = f"DESCRIBE {table_name}"
+        params = None
+        if self._dialect == "postgres":
+            # Bound parameter: no injection, and one statement text for every table
+            sql = _PG_DESCRIBE_SQL
+            params = (table_name,)
+        elif self._dialect == "mysql":
+            # Identifiers can't be bound — validate, then backtick-quote
+            if not _IDENTIFIER_RE.match(table_name):
+                return {"error": f"Invalid table name: {table_name!r}"}
+            sql = f"SHOW COLUMNS FROM `{table_name}`"
         else:
             return {"error": "Unsupported database type."}
 
-        result = self.query(sql)
+        result = self._cached_query(self._schema_cache, sql, params=params)
         if "error" in result:
             return result
 
         return {"table": table_name, "columns": result.get("rows", [])}
 
-    def _query_postgres(self, sql: str) -> dict:
+    def _get_pool(self, factory):
+        """Return the shared pool for this URL, creating it on first use."""
+        pool = self._pools.get(self._db_url)
+        if pool is None:
+            with self._pools_lock:
+                pool = self._pools.get(self._db_url)
+                if pool is None:
+                    pool = self._pools[self._db_url] = factory()
+        return pool
+
+    def _query_postgres(self, sql: str, max_rows: Optional[int] = None, params: Optional[tuple] = None) -> dict:
         try:
             import psycopg2
             import psycopg2.extras
+            import psycopg2.pool
         except ImportError:
             return {"error": "psycopg2 not installed. Run: pip install psycopg2-binary"}
 
-        conn = psycopg2.connect(self._db_url)
+        pool = self._get_pool(lambda: _BlockingPool(
+            psycopg2.pool.ThreadedConnectionPool(1, _POOL_MAX, dsn=self._db_url), _POOL_MAX
+        ))
+        conn = pool.getconn()
+        # SELECT-style statements use a named (server-side) cursor so Postgres
+        # streams the result in itersize batches instead of buffering it all
+        # client-side; DECLARE CURSOR rejects SHOW/EXPLAIN, which stay client-side.
+        name = None
+        if _STREAMABLE_RE.match(sql):
+            name = f"lookup_{os.urandom(8).hex()}"
         try:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-                cur.execute(sql)
-                rows = cur.fetchall()
+            with conn.cursor(name=name, cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                if name:
+                    cur.itersize = _SERVER_CURSOR_ITERSIZE
+                cur.execute(sql, params)
+                # RealDictRow is already a dict — no per-row copy
+                rows = list(cur) if max_rows is None else cur.fetchmany(max_rows)
                 columns = [desc[0] for desc in cur.description] if cur.description else []
-                return {"rows": [dict(r) for r in rows], "row_count": len(rows), "columns": columns}
+                return {"rows": rows, "row_count": len(rows), "columns": columns}
         finally:
-            conn.close()
+            # putconn rolls back the implicit read transaction before reuse
+            pool.putconn(conn, close=bool(conn.closed))
 
-    def _query_mysql(self, sql: str) -> dict:
+    def _query_mysql(self, sql: str, max_rows: Optional[int] = None, params: Optional[tuple] = None) -> dict:
         try:
             import pymysql
         except ImportError:
             return {"error": "pymysql not installed. Run: pip install pymysql"}
 
-        parsed = urlparse(self._db_url)
-        conn = pymysql.connect(
-            host=parsed.hostname,
-            port=parsed.port or 3306,
-            user=parsed.username,
-            password=parsed.password,
-            database=parsed.path.lstrip("/"),
-            cursorclass=pymysql.cursors.DictCursor,
-        )
+        pool = self._get_pool(lambda: _MySQLPool(
+            # autocommit: a reused connection must not keep reading an old snapshot
+            lambda: pymysql.connect(
+                cursorclass=pymysql.cursors.DictCursor, autocommit=True, **self._mysql_params
+            ),
+            _POOL_MAX,
+        ))
+        conn = pool.getconn()
         try:
             with conn.cursor() as cur:
-                cur.execute(sql)
-                rows = cur.fetchall()
+                cur.execute(sql, params)
+                rows = cur.fetchall() if max_rows is None else cur.fetchmany(max_rows)
                 return {
                     "rows": rows,
                     "row_count": len(rows),
                     "columns": list(rows[0].keys()) if rows else [],
                 }
         finally:
-            conn.close()
+            pool.putconn(conn, close=not conn.open)
 
 
 # Backward compatibility
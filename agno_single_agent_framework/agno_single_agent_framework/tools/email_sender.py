@@ -4,11 +4,18 @@ Email Sender Toolkit — Send emails via SMTP using Agno framework.
 Setup:
   Set SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASSWORD in .env
   For Gmail: SMTP_HOST=smtp.gmail.com, SMTP_PORT=587, use App Password
+  SMTP_PORT=465 connects with implicit TLS (SMTP_SSL) instead of STARTTLS
+
+The authenticated SMTP session is kept open and reused across sends;
+it is re-established once if the server has dropped it, and a failed
+connect is retried once.
 """
 
 import os
 import smtplib
 import logging
+import threading
+from typing import List
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from agno.tools import Toolkit
@@ -33,9 +40,12 @@ class EmailSenderToolkit(Toolkit):
         self._user = smtp_user or os.getenv("SMTP_USER")
         self._password = smtp_password or os.getenv("SMTP_PASSWORD")
         self._from = from_address or os.getenv("SMTP_FROM", self._user)
+        self._smtp = None
+        self._smtp_lock = threading.Lock()   # smtplib sessions aren't thread-safe
 
         self.register(self.send_email)
         self.register(self.send_html_email)
+        self.register(self.send_bulk)
 
     def send_email(self, to: str, subject: str, body: str) -> dict:
         """
@@ -65,24 +75,51 @@ class EmailSenderToolkit(Toolkit):
         """
         return self._send(to, subject, html_body, is_html=True)
 
+    def send_bulk(self, recipients: List[str], subject: str, body: str, is_html: bool = False) -> dict:
+        """
+        Send the same email to many recipients, one message each, over a single SMTP session.
+
+        Args:
+            recipients: List of recipient email addresses
+            subject: Email subject line
+            body: Email body content (plain text, or HTML if is_html is true)
+            is_html: If true, body is treated as HTML
+
+        Returns:
+            A dictionary with the number sent and a list of failed recipients with errors
+        """
+        if not all([self._host, self._user, self._password]):
+            return {"error": "SMTP not configured. Set SMTP_HOST, SMTP_USER, SMTP_PASSWORD in .env"}
+
+        sent = 0
+        failed = []
+        for to in recipients:
+            try:
+                self._send_message(self._build_message(to, subject, body, is_html))
+                sent += 1
+            except Exception as e:
+                logger.error(f"Email send failed for {to}: {e}")
+                failed.append({"to": to, "error": str(e)})
+
+        logger.info(f"Bulk email sent to {sent}/{len(recipients)} recipients: {subject}")
+        return {"sent": sent, "failed": failed}
+
+    def _build_message(self, to: str, subject: str, body: str, is_html: bool) -> MIMEMultipart:
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = subject
+        msg["From"] = self._from
+        msg["To"] = to
+        msg.attach(MIMEText(body, "html" if is_html else "plain"))
+        return msg
+
     def _send(self, to: str, subject: str, body: str, is_html: bool = False) -> dict:
         """Internal method to send the email."""
         if not all([self._host, self._user, self._password]):
             return {"error": "SMTP not configured. Set SMTP_HOST, SMTP_USER, SMTP_PASSWORD in .env"}
 
         try:
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = subject
-            msg["From"] = self._from
-            msg["To"] = to
-
             content_type = "html" if is_html else "plain"
-            msg.attach(MIMEText(body, content_type))
-
-            with smtplib.SMTP(self._host, self._port) as server:
-                server.starttls()
-                server.login(self._user, self._password)
-                server.send_message(msg)
+            self._send_message(self._build_message(to, subject, body, is_html))
 
             logger.info(f"Email sent to {to}: {subject}")
             return {"status": "sent", "to": to, "subject": subject, "format": content_type}
@@ -91,6 +128,53 @@ class EmailSenderToolkit(Toolkit):
             logger.error(f"Email send failed: {e}")
             return {"error": str(e)}
 
+    def _connect(self) -> smtplib.SMTP:
+        """Open and log in a session, retrying once on a connection-level failure."""
+        try:
+            return self._open()
+        except smtplib.SMTPException as e:
+            if not isinstance(e, (smtplib.SMTPConnectError, smtplib.SMTPServerDisconnected)):
+                raise   # auth/protocol errors won't fix themselves
+            logger.warning(f"SMTP connect failed, retrying once: {e}")
+        except OSError as e:   # refused, reset, timed out
+            logger.warning(f"SMTP connect failed, retrying once: {e}")
+        return self._open()
+
+    def _open(self) -> smtplib.SMTP:
+        implicit_tls = self._port == 465
+        server = (smtplib.SMTP_SSL if implicit_tls else smtplib.SMTP)(self._host, self._port)
+        try:
+            if not implicit_tls:
+                server.starttls()
+            server.login(self._user, self._password)
+        except BaseException:
+            server.close()
+            raise
+        return server
+
+    def _send_message(self, msg) -> None:
+        """Send over the pooled session, reconnecting once if it went stale."""
+        with self._smtp_lock:
+            if self._smtp is None:
+                self._smtp = self._connect()
+            try:
+                self._smtp.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                stale, self._smtp = self._smtp, None
+                stale.close()
+                self._smtp = self._connect()
+                self._smtp.send_message(msg)
+
+    def close(self):
+        """Close the pooled SMTP session, if one is open."""
+        with self._smtp_lock:
+            server, self._smtp = self._smtp, None
+        if server is not None:
+            try:
+                server.quit()
+            except smtplib.SMTPException:
+                server.close()
+
 
 # Backward compatibility
 DESCRIPTION = "Send an email via SMTP. Supports plain text and HTML content."
@@ -105,4 +189,7 @@ PARAMETERS = {
 def run(to: str, subject: str, body: str, is_html: bool = False) -> dict:
     """Send an email (legacy interface)."""
     toolkit = EmailSenderToolkit()
-    return toolkit._send(to, subject, body, is_html)
+    try:
+        return toolkit._send(to, subject, body, is_html)
+    finally:
+        toolkit.close()
@@ -4,25 +4,51 @@ File Parser Toolkit — Extract text from files using Agno framework.
 Supports: PDF, DOCX, CSV, Excel, TXT
 
 Setup:
-  pip install PyPDF2 python-docx openpyxl pandas
+  pip install pypdf python-docx openpyxl xlrd
 """
 
 import os
 import csv
+import asyncio
 import logging
+import functools
+import importlib
+from itertools import islice
 from agno.tools import Toolkit
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _optional_module(*names):
+    """
+    First importable module among `names`, or None — resolved once per process.
+    A missing optional dependency otherwise re-runs the full sys.path finder
+    search on every call.
+    """
+    for name in names:
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            continue
+    return None
+
+
+# Characters of a text file returned to the agent
+_TEXT_PREVIEW_CHARS = 5000
+
+
 class FileParserToolkit(Toolkit):
     """Toolkit for extracting text content from various file types."""
 
-    def __init__(self):
+    def __init__(self, async_tools: bool = False):
         super().__init__(name="file_parser")
         self.register(self.parse_file)
         self.register(self.parse_pdf)
         self.register(self.parse_csv)
+        # Opt-in: async tools are only usable from async agent runs (arun)
+        if async_tools:
+            self.register(self.aparse_file)
 
     def parse_file(self, file_path: str, max_pages: int = 10) -> dict:
         """
@@ -61,6 +87,22 @@ class FileParserToolkit(Toolkit):
             logger.error(f"File parsing failed for {file_path}: {e}")
             return {"error": str(e)}
 
+    async def aparse_file(self, file_path: str, max_pages: int = 10) -> dict:
+        """
+        Parse any supported file without blocking the event loop.
+
+        Supported file types: PDF, DOCX, CSV, XLSX, XLS, TXT
+
+        Args:
+            file_path: Absolute or relative path to the file to parse
+            max_pages: Maximum number of pages to extract for PDF files (default 10)
+
+        Returns:
+            A dictionary with file type, content, and metadata
+        """
+        # Parsing is blocking I/O plus CPU work — run it on the default thread pool
+        return await asyncio.to_thread(self.parse_file, file_path, max_pages)
+
     def parse_pdf(self, file_path: str, max_pages: int = 10) -> dict:
         """
         Extract text content from a PDF file.
@@ -70,7 +112,7 @@ class FileParserToolkit(Toolkit):
             max_pages: Maximum number of pages to extract (default 10)
 
         Returns:
-            A dictionary with total pages, extracted pages, and page-by-page text
+            A dictionary with total pages, extracted pages, page-by-page text, and the joined full text
         """
         if not os.path.exists(file_path):
             return {"error": f"File not found: {file_path}"}
@@ -90,41 +132,33 @@ class FileParserToolkit(Toolkit):
         if not os.path.exists(file_path):
             return {"error": f"File not found: {file_path}"}
         try:
-            with open(file_path, "r", encoding="utf-8-sig") as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-            return {
-                "type": "csv",
-                "row_count": len(rows),
-                "columns": list(rows[0].keys()) if rows else [],
-                "rows": rows[:max_rows],
-            }
+            return _read_csv(file_path, max_rows)
         except Exception as e:
             return {"error": str(e)}
 
     def _parse_pdf(self, file_path: str, max_pages: int = 10, **kwargs) -> dict:
-        try:
-            from PyPDF2 import PdfReader
-        except ImportError:
-            return {"error": "PyPDF2 not installed. Run: pip install PyPDF2"}
+        pypdf = _optional_module("pypdf", "PyPDF2")   # PyPDF2: legacy name of pypdf
+        if pypdf is None:
+            return {"error": "pypdf not installed. Run: pip install pypdf"}
 
-        reader = PdfReader(file_path)
-        pages = []
-        for i, page in enumerate(reader.pages[:max_pages]):
-            text = page.extract_text() or ""
-            pages.append({"page": i + 1, "text": text.strip()})
+        reader = pypdf.PdfReader(file_path)
+        # len() flattens the page tree once; text extraction, the costly part,
+        # only runs for the first max_pages pages
+        total_pages = len(reader.pages)
+        texts = [(page.extract_text() or "").strip() for page in islice(reader.pages, max_pages)]
+        pages = [{"page": i + 1, "text": text} for i, text in enumerate(texts)]
 
         return {
             "type": "pdf",
-            "total_pages": len(reader.pages),
+            "total_pages": total_pages,
             "extracted_pages": len(pages),
             "pages": pages,
+            "full_text": "\n\n".join(texts),   # one join, not per-page concatenation downstream
         }
 
     def _parse_docx(self, file_path: str, **kwargs) -> dict:
-        try:
-            import docx
-        except ImportError:
+        docx = _optional_module("docx")
+        if docx is None:
             return {"error": "python-docx not installed. Run: pip install python-docx"}
 
         doc = docx.Document(file_path)
@@ -132,34 +166,84 @@ class FileParserToolkit(Toolkit):
         return {"type": "docx", "paragraphs": len(paragraphs), "text": "\n".join(paragraphs)}
 
     def _parse_csv(self, file_path: str, **kwargs) -> dict:
-        with open(file_path, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-        return {
-            "type": "csv",
-            "row_count": len(rows),
-            "columns": list(rows[0].keys()) if rows else [],
-            "rows": rows[:50],
-        }
+        return _read_csv(file_path, max_rows=50)
 
-    def _parse_excel(self, file_path: str, **kwargs) -> dict:
-        try:
-            import pandas as pd
-        except ImportError:
-            return {"error": "pandas/openpyxl not installed. Run: pip install pandas openpyxl"}
+    def _parse_excel(self, file_path: str, max_rows: int = 50, **kwargs) -> dict:
+        if file_path.lower().endswith(".xls"):
+            return self._parse_xls(file_path, max_rows)
 
-        df = pd.read_excel(file_path, nrows=50)
-        return {
-            "type": "excel",
-            "row_count": len(df),
-            "columns": list(df.columns),
-            "rows": df.to_dict(orient="records"),
-        }
+        openpyxl = _optional_module("openpyxl")
+        if openpyxl is None:
+            return {"error": "openpyxl not installed. Run: pip install openpyxl"}
+
+        # read_only streams the sheet XML instead of building the full cell graph
+        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows_iter = wb.active.iter_rows(max_row=max_rows + 1, values_only=True)
+            columns = _excel_headers(next(rows_iter, ()))
+            rows = [dict(zip(columns, row)) for row in rows_iter]
+        finally:
+            wb.close()   # read-only workbooks hold the file open
+        return {"type": "excel", "row_count": len(rows), "columns": columns, "rows": rows}
+
+    def _parse_xls(self, file_path: str, max_rows: int = 50) -> dict:
+        xlrd = _optional_module("xlrd")
+        if xlrd is None:
+            return {"error": "xlrd not installed (needed for .xls). Run: pip install xlrd"}
+
+        wb = xlrd.open_workbook(file_path, on_demand=True)
+        try:
+            sheet = wb.sheet_by_index(0)
+            columns = _excel_headers(sheet.row_values(0) if sheet.nrows else ())
+            rows = [
+                dict(zip(columns, sheet.row_values(i)))
+                for i in range(1, min(sheet.nrows, max_rows + 1))
+            ]
+        finally:
+            wb.release_resources()
+        return {"type": "excel", "row_count": len(rows), "columns": columns, "rows": rows}
 
     def _parse_text(self, file_path: str, **kwargs) -> dict:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        return {"type": "text", "char_count": len(content), "text": content[:5000]}
+        # Text-mode read(n) counts characters, so only the preview is ever decoded
+        size = os.path.getsize(file_path)
+        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+            content = f.read(_TEXT_PREVIEW_CHARS)
+        return {"type": "text", "file_size_bytes": size, "text": content}
+
+
+def _row_dict(columns: list, row: list) -> dict:
+    """Map a row onto the header exactly as csv.DictReader does."""
+    record = dict(zip(columns, row))
+    if len(row) > len(columns):
+        record[None] = row[len(columns):]   # DictReader's restkey
+    elif len(row) < len(columns):
+        for name in columns[len(row):]:
+            record[name] = None             # DictReader's restval
+    return record
+
+
+def _read_csv(file_path: str, max_rows: int) -> dict:
+    """Header plus the first max_rows rows as dicts; the rest are only counted."""
+    with open(file_path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        columns = next(reader, [])
+        records = filter(None, reader)   # skip blank lines, as DictReader does
+        rows = [_row_dict(columns, row) for row in islice(records, max_rows)]
+        remaining = sum(1 for _ in records)   # csv-aware: quoted newlines don't miscount
+    return {
+        "type": "csv",
+        "row_count": len(rows) + remaining,
+        "columns": columns if rows else [],
+        "rows": rows,
+    }
+
+
+def _excel_headers(header_row) -> list:
+    """Column names from a header row, naming blank cells like pandas does."""
+    return [
+        f"Unnamed: {i}" if value is None or value == "" else str(value)
+        for i, value in enumerate(header_row)
+    ]
 
 
 # Backward compatibility
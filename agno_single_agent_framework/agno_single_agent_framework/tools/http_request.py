@@ -3,28 +3,172 @@ HTTP Request Toolkit — Make external API calls using Agno framework.
 
 Useful for agents that need to fetch data from REST APIs,
 check service status, or interact with third-party services.
+
+Async variants (arequest/aget/apost) use httpx and share one pooled
+AsyncClient per event loop, so concurrent calls fan out over kept-alive
+connections instead of blocking the loop.
+
+Repeated GETs are revalidated with If-None-Match / If-Modified-Since when
+the server sent an ETag or Last-Modified; a 304 returns the cached result.
 """
 
+import copy
+import json
+import functools
 import logging
+import weakref
 from agno.tools import Toolkit
 
+from agno_single_agent_framework.tools._cache import TTLCache
+from agno_single_agent_framework.tools._http import get_async_client
+
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
+_BODY_METHODS = ("POST", "PUT", "PATCH")
+
+# Keep-alive pool per toolkit session; retries cover dropped/reset connections
+# (urllib3 never retries POST/PATCH by default)
+_POOL_CONNECTIONS = 16
+_POOL_MAXSIZE = 32
+_MAX_RETRIES = 2
+
+# GET results kept for conditional revalidation, per toolkit
+_VALIDATOR_CACHE_SIZE = 256
+_VALIDATOR_CACHE_TTL = 3600   # seconds
+
+
+# Non-JSON bodies are streamed and cut off here — enough bytes for the
+# 2000-character text preview even with multi-byte UTF-8
+_BODY_CHUNK = 4096
+_TEXT_BODY_CAP = 8192
+
+
+def _wants_full_body(resp) -> bool:
+    """JSON responses are read whole so they can be parsed; anything else is capped."""
+    return "json" in resp.headers.get("Content-Type", "").lower()
+
+
+def _read_body(resp) -> tuple:
+    """(raw bytes, complete) from a streamed requests response."""
+    full = _wants_full_body(resp)
+    chunks, size = [], 0
+    for chunk in resp.iter_content(_BODY_CHUNK):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= _TEXT_BODY_CAP and not full:
+            return b"".join(chunks), False
+    return b"".join(chunks), True
+
+
+async def _aread_body(resp) -> tuple:
+    """(raw bytes, complete) from a streamed httpx response."""
+    full = _wants_full_body(resp)
+    chunks, size = [], 0
+    async for chunk in resp.aiter_bytes(_BODY_CHUNK):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= _TEXT_BODY_CAP and not full:
+            return b"".join(chunks), False
+    return b"".join(chunks), True
+
+
+def _parse_body(raw: bytes, encoding: str, complete: bool):
+    # Try to parse as JSON, fallback to text
+    if complete:
+        try:
+            return json.loads(raw)
+        except ValueError:
+            pass
+    try:
+        text = raw.decode(encoding or "utf-8", errors="replace")
+    except LookupError:   # unknown charset label
+        text = raw.decode("utf-8", errors="replace")
+    return text[:2000]  # Limit text response size
+
+
+def _build_response(resp, url: str, method: str, response_body) -> dict:
+    """Shape a requests/httpx response into the toolkit's result dict."""
+    return {
+        "status_code": resp.status_code,
+        "headers": dict(resp.headers),
+        "body": response_body,
+        "url": url,
+        "method": method,
+    }
+
 
 class HTTPRequestToolkit(Toolkit):
     """Toolkit for making HTTP requests to external APIs."""
 
-    def __init__(self):
+    def __init__(self, async_tools: bool = False):
         super().__init__(name="http_request")
+        self._etag_cache = TTLCache(_VALIDATOR_CACHE_SIZE, _VALIDATOR_CACHE_TTL)
+        self._session = None
+        if requests is not None:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=_POOL_CONNECTIONS,
+                pool_maxsize=_POOL_MAXSIZE,
+                max_retries=Retry(total=_MAX_RETRIES, backoff_factor=0.1),
+            )
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+            # Closes the pool on GC or at interpreter exit, without keeping self alive
+            self._finalizer = weakref.finalize(self, self._session.close)
         self.register(self.get)
         self.register(self.post)
         self.register(self.put)
         self.register(self.request)
+        # Opt-in: async tools are only usable from async agent runs (arun)
+        if async_tools:
+            self.register(self.arequest)
+            self.register(self.aget)
+            self.register(self.apost)
+
+    def close(self):
+        """Close pooled connections held by this toolkit's session."""
+        if self._session is not None:
+            self._finalizer()
+
+    def _revalidation(self, method: str, url: str, headers: dict) -> tuple:
+        """(cache key, cached result, headers with validators added) for a request."""
+        if method != "GET":
+            return None, None, headers
+        key = (url, tuple(sorted(headers.items())))
+        entry = self._etag_cache.get(key)
+        if entry is None:
+            return key, None, headers
+        validators, cached = entry
+        return key, cached, {**validators, **headers}   # caller's own headers win
+
+    def _finish(self, key, cached, resp, url: str, method: str, response_body) -> dict:
+        """Serve a 304 from cache, otherwise build the result and remember its validators."""
+        if cached is not None and resp.status_code == 304:
+            return copy.deepcopy(cached)   # callers may mutate; the cached entry must not change
+        result = _build_response(resp, url, method, response_body)
+        if key is not None and resp.status_code == 200:
+            validators = {}
+            etag = resp.headers.get("ETag")
+            if etag:
+                validators["If-None-Match"] = etag
+            last_modified = resp.headers.get("Last-Modified")
+            if last_modified:
+                validators["If-Modified-Since"] = last_modified
+            if validators:
+                self._etag_cache.set(key, (validators, copy.deepcopy(result)))
+        return result
 
     def request(self, url: str, method: str = "GET", headers: dict = None, body: dict = None, timeout: int = 10) -> dict:
         """
@@ -43,28 +187,22 @@ class HTTPRequestToolkit(Toolkit):
         if requests is None:
             return {"error": "requests package not installed. Run: pip install requests"}
 
+        method = method.upper()
+        key, cached, send_headers = self._revalidation(method, url, headers or {})
         try:
-            resp = requests.request(
-                method=method.upper(),
+            resp = self._session.request(
+                method=method,
                 url=url,
-                headers=headers or {},
-                json=body if method.upper() in ("POST", "PUT", "PATCH") else None,
+                headers=send_headers,
+                json=body if method in _BODY_METHODS else None,
                 timeout=timeout,
+                stream=True,
             )
-
-            # Try to parse as JSON, fallback to text
             try:
-                response_body = resp.json()
-            except ValueError:
-                response_body = resp.text[:2000]  # Limit text response size
-
-            return {
-                "status_code": resp.status_code,
-                "headers": dict(resp.headers),
-                "body": response_body,
-                "url": url,
-                "method": method.upper(),
-            }
+                raw, complete = _read_body(resp)
+            finally:
+                resp.close()   # returns the connection even when the body was cut off
+            return self._finish(key, cached, resp, url, method, _parse_body(raw, resp.encoding, complete))
         except requests.exceptions.Timeout:
             return {"error": f"Request timed out after {timeout}s", "url": url}
         except requests.exceptions.ConnectionError:
@@ -117,6 +255,72 @@ class HTTPRequestToolkit(Toolkit):
         """
         return self.request(url, method="PUT", headers=headers, body=body, timeout=timeout)
 
+    async def arequest(self, url: str, method: str = "GET", headers: dict = None, body: dict = None, timeout: int = 10) -> dict:
+        """
+        Make an HTTP request to an external API without blocking the event loop.
+
+        Args:
+            url: The target URL
+            method: HTTP method (GET, POST, PUT, PATCH)
+            headers: Optional request headers dictionary
+            body: Optional JSON body for POST/PUT/PATCH requests
+            timeout: Timeout in seconds (default 10)
+
+        Returns:
+            A dictionary with status_code, headers, and response body
+        """
+        if httpx is None:
+            return {"error": "httpx package not installed. Run: pip install httpx"}
+
+        method = method.upper()
+        key, cached, send_headers = self._revalidation(method, url, headers or {})
+        try:
+            async with get_async_client().stream(
+                method,
+                url,
+                headers=send_headers,
+                json=body if method in _BODY_METHODS else None,
+                timeout=timeout,
+            ) as resp:
+                raw, complete = await _aread_body(resp)
+            return self._finish(key, cached, resp, url, method, _parse_body(raw, resp.encoding, complete))
+        except httpx.TimeoutException:
+            return {"error": f"Request timed out after {timeout}s", "url": url}
+        except httpx.ConnectError:
+            return {"error": f"Connection failed to {url}"}
+        except Exception as e:
+            logger.error(f"HTTP request failed: {e}")
+            return {"error": str(e)}
+
+    async def aget(self, url: str, headers: dict = None, timeout: int = 10) -> dict:
+        """
+        Make an async HTTP GET request.
+
+        Args:
+            url: The target URL
+            headers: Optional request headers
+            timeout: Timeout in seconds (default 10)
+
+        Returns:
+            A dictionary with status_code, headers, and response body
+        """
+        return await self.arequest(url, method="GET", headers=headers, timeout=timeout)
+
+    async def apost(self, url: str, body: dict = None, headers: dict = None, timeout: int = 10) -> dict:
+        """
+        Make an async HTTP POST request with JSON body.
+
+        Args:
+            url: The target URL
+            body: JSON body to send
+            headers: Optional request headers
+            timeout: Timeout in seconds (default 10)
+
+        Returns:
+            A dictionary with status_code, headers, and response body
+        """
+        return await self.arequest(url, method="POST", headers=headers, body=body, timeout=timeout)
+
 
 # Backward compatibility
 DESCRIPTION = "Make HTTP GET/POST requests to external APIs. Returns status code, headers, and body."
@@ -129,7 +333,12 @@ PARAMETERS = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _legacy_toolkit() -> HTTPRequestToolkit:
+    # Shared so legacy callers also reuse one keep-alive session
+    return HTTPRequestToolkit()
+
+
 def run(url: str, method: str = "GET", headers: dict = None, body: dict = None, timeout: int = 10) -> dict:
     """Make an HTTP request and return the response (legacy interface)."""
-    toolkit = HTTPRequestToolkit()
-    return toolkit.request(url, method, headers, body, timeout)
+    return _legacy_toolkit().request(url, method, headers, body, timeout)
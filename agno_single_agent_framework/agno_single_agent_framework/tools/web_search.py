@@ -4,26 +4,124 @@ Web Search Toolkit — Search the web using SerpAPI or Tavily via Agno framework
 Setup:
   pip install requests
   Set SERP_API_KEY or TAVILY_API_KEY in .env
+  Optional: WEB_SEARCH_CACHE_TTL (seconds, default 300; 0 disables caching)
+  Optional: pip install httpx — enables asearch(), which queries every
+  configured provider concurrently and returns the first successful answer
 """
 
 import os
+import copy
+import asyncio
 import logging
 from agno.tools import Toolkit
 
+from agno_single_agent_framework.tools._cache import TTLCache
+from agno_single_agent_framework.tools._http import get_async_client
+
 try:
     import requests
 except ImportError:
     requests = None
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
 
+def _cache_ttl_from_env(default: float = 300.0) -> float:
+    raw = os.getenv("WEB_SEARCH_CACHE_TTL")
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning(f"Invalid WEB_SEARCH_CACHE_TTL={raw!r}, using {default:g}s")
+        return default
+
+
+# Results shared across toolkit instances — identical queries skip the paid API call
+_SEARCH_CACHE_TTL = _cache_ttl_from_env()
+_SEARCH_CACHE = TTLCache(maxsize=1024, ttl=_SEARCH_CACHE_TTL)
+
+# One keep-alive session for every sync search — TLS to the provider is reused
+_session = requests.Session() if requests is not None else None
+
+_SEARCH_TIMEOUT = 10
+
+
+def _tavily_request(query: str, num_results: int, api_key: str) -> tuple:
+    return "POST", "https://api.tavily.com/search", {
+        "json": {
+            "api_key": api_key,
+            "query": query,
+            "max_results": num_results,
+            "search_depth": "basic",
+        },
+    }
+
+
+def _tavily_results(query: str, data: dict) -> dict:
+    results = []
+    for r in data.get("results", []):
+        results.append({
+            "title": r.get("title", ""),
+            "snippet": r.get("content", "")[:200],
+            "url": r.get("url", ""),
+        })
+    return {"provider": "tavily", "query": query, "results": results}
+
+
+def _serpapi_request(query: str, num_results: int, api_key: str) -> tuple:
+    return "GET", "https://serpapi.com/search", {
+        "params": {
+            "q": query,
+            "api_key": api_key,
+            "num": num_results,
+            "engine": "google",
+        },
+    }
+
+
+def _serpapi_results(query: str, data: dict) -> dict:
+    results = []
+    for r in data.get("organic_results", []):
+        results.append({
+            "title": r.get("title", ""),
+            "snippet": r.get("snippet", ""),
+            "url": r.get("link", ""),
+        })
+    return {"provider": "serpapi", "query": query, "results": results}
+
+
+# provider -> (label, env var, request builder, result parser), in priority order
+_PROVIDERS = {
+    "tavily":  ("Tavily", "TAVILY_API_KEY", _tavily_request, _tavily_results),
+    "serpapi": ("SerpAPI", "SERP_API_KEY", _serpapi_request, _serpapi_results),
+}
+
+
+def _configured_providers() -> list:
+    """(provider, api_key) for every provider with a key set, in priority order."""
+    configured = []
+    for provider, (_, env_var, _, _) in _PROVIDERS.items():
+        api_key = os.getenv(env_var)
+        if api_key:
+            configured.append((provider, api_key))
+    return configured
+
+
 class WebSearchToolkit(Toolkit):
     """Toolkit for searching the web using Tavily or SerpAPI."""
 
-    def __init__(self):
+    def __init__(self, async_tools: bool = False):
         super().__init__(name="web_search")
         self.register(self.search)
+        # Opt-in: async tools are only usable from async agent runs (arun)
+        if async_tools:
+            self.register(self.asearch)
 
     def search(self, query: str, num_results: int = 5) -> dict:
         """
@@ -40,72 +138,89 @@ class WebSearchToolkit(Toolkit):
             return {"error": "requests package not installed. Run: pip install requests"}
 
         # Try Tavily first, then SerpAPI, then fallback
-        tavily_key = os.getenv("TAVILY_API_KEY")
-        serp_key = os.getenv("SERP_API_KEY")
-
-        if tavily_key:
-            return self._search_tavily(query, num_results, tavily_key)
-        elif serp_key:
-            return self._search_serpapi(query, num_results, serp_key)
-        else:
+        configured = _configured_providers()
+        if not configured:
             return {"error": "No search API key configured. Set TAVILY_API_KEY or SERP_API_KEY."}
+        provider, api_key = configured[0]
+
+        if _SEARCH_CACHE_TTL <= 0:
+            return self._search(provider, query, num_results, api_key)
+
+        # Cached results are copied in and out — callers may mutate what they get
+        key = (provider, query, num_results)
+        result = _SEARCH_CACHE.get(key)
+        if result is not None:
+            return copy.deepcopy(result)
+        result = self._search(provider, query, num_results, api_key)
+        if "error" not in result:   # failures are retried, not cached
+            _SEARCH_CACHE.set(key, copy.deepcopy(result))
+        return result
+
+    async def asearch(self, query: str, num_results: int = 5) -> dict:
+        """
+        Search the web for real-time information, querying every configured provider concurrently.
 
-    def _search_tavily(self, query: str, num_results: int, api_key: str) -> dict:
-        """Search using Tavily API."""
-        try:
-            resp = requests.post(
-                "https://api.tavily.com/search",
-                json={
-                    "api_key": api_key,
-                    "query": query,
-                    "max_results": num_results,
-                    "search_depth": "basic",
-                },
-                timeout=10,
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        Args:
+            query: The search query string
+            num_results: Number of results to return (default 5)
+
+        Returns:
+            A dictionary containing search results with titles, snippets, and URLs
+        """
+        if httpx is None:
+            return {"error": "httpx package not installed. Run: pip install httpx"}
 
-            results = []
-            for r in data.get("results", []):
-                results.append({
-                    "title": r.get("title", ""),
-                    "snippet": r.get("content", "")[:200],
-                    "url": r.get("url", ""),
-                })
+        configured = _configured_providers()
+        if not configured:
+            return {"error": "No search API key configured. Set TAVILY_API_KEY or SERP_API_KEY."}
 
-            return {"provider": "tavily", "query": query, "results": results}
+        use_cache = _SEARCH_CACHE_TTL > 0
+        if use_cache:
+            for provider, _ in configured:
+                result = _SEARCH_CACHE.get((provider, query, num_results))
+                if result is not None:
+                    return copy.deepcopy(result)
+
+        # Fastest successful provider wins; an error only counts if every provider fails
+        pending = {
+            asyncio.ensure_future(self._asearch(provider, query, num_results, api_key))
+            for provider, api_key in configured
+        }
+        result = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if "error" not in result:
+                        if use_cache:
+                            _SEARCH_CACHE.set((result["provider"], query, num_results), copy.deepcopy(result))
+                        return result
+        finally:
+            for task in pending:
+                task.cancel()
+        return result
+
+    def _search(self, provider: str, query: str, num_results: int, api_key: str) -> dict:
+        label, _, build_request, parse_results = _PROVIDERS[provider]
+        method, url, kwargs = build_request(query, num_results, api_key)
+        try:
+            resp = _session.request(method, url, timeout=_SEARCH_TIMEOUT, **kwargs)
+            resp.raise_for_status()
+            return parse_results(query, resp.json())
         except Exception as e:
-            logger.error(f"Tavily search failed: {e}")
+            logger.error(f"{label} search failed: {e}")
             return {"error": str(e)}
 
-    def _search_serpapi(self, query: str, num_results: int, api_key: str) -> dict:
-        """Search using SerpAPI."""
+    async def _asearch(self, provider: str, query: str, num_results: int, api_key: str) -> dict:
+        label, _, build_request, parse_results = _PROVIDERS[provider]
+        method, url, kwargs = build_request(query, num_results, api_key)
         try:
-            resp = requests.get(
-                "https://serpapi.com/search",
-                params={
-                    "q": query,
-                    "api_key": api_key,
-                    "num": num_results,
-                    "engine": "google",
-                },
-                timeout=10,
-            )
+            resp = await get_async_client().request(method, url, timeout=_SEARCH_TIMEOUT, **kwargs)
             resp.raise_for_status()
-            data = resp.json()
-
-            results = []
-            for r in data.get("organic_results", []):
-                results.append({
-                    "title": r.get("title", ""),
-                    "snippet": r.get("snippet", ""),
-                    "url": r.get("link", ""),
-                })
-
-            return {"provider": "serpapi", "query": query, "results": results}
+            return parse_results(query, resp.json())
         except Exception as e:
-            logger.error(f"SerpAPI search failed: {e}")
+            logger.error(f"{label} search failed: {e}")
             return {"error": str(e)}
 
 
@@ -121,63 +236,3 @@ def run(query: str, num_results: int = 5) -> dict:
     """Search the web and return structured results (legacy interface)."""
     toolkit = WebSearchToolkit()
     return toolkit.search(query, num_results)
-
-
-def _search_tavily(query: str, num_results: int, api_key: str) -> dict:
-    """Search using Tavily API."""
-    try:
-        resp = requests.post(
-            "https://api.tavily.com/search",
-            json={
-                "api_key": api_key,
-                "query": query,
-                "max_results": num_results,
-                "search_depth": "basic",
-            },
-            timeout=10,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-
-        results = []
-        for r in data.get("results", []):
-            results.append({
-                "title": r.get("title", ""),
-                "snippet": r.get("content", "")[:200],
-                "url": r.get("url", ""),
-            })
-
-        return {"provider": "tavily", "query": query, "results": results}
-    except Exception as e:
-        logger.error(f"Tavily search failed: {e}")
-        return {"error": str(e)}
-
-
-def _search_serpapi(query: str, num_results: int, api_key: str) -> dict:
-    """Search using SerpAPI."""
-    try:
-        resp = requests.get(
-            "https://serpapi.com/search",
-            params={
-                "q": query,
-                "api_key": api_key,
-                "num": num_results,
-                "engine": "google",
-            },
-            timeout=10,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-
-        results = []
-        for r in data.get("organic_results", []):
-            results.append({
-                "title": r.get("title", ""),
-                "snippet": r.get("snippet", ""),
-                "url": r.get("link", ""),
-            })
-
-        return {"provider": "serpapi", "query": query, "results": results}
-    except Exception as e:
-        logger.error(f"SerpAPI search failed: {e}")
-        return {"error": str(e)}
@@ -15,17 +15,49 @@ Or with AgentOS (recommended for production):
     fastapi dev main.py
 """
 
+import json
 import logging
 from typing import Optional, AsyncIterator
 
 from fastapi import FastAPI
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response
 from pydantic import BaseModel
 
+from agno_single_agent_framework.core.streaming import batch_chunks, send_frames
 from agent import MyAgent   # Your custom agent — see agent.py
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# SSE batching — tokens are coalesced into one frame until either bound is hit
+BATCH_MAX_TOKENS = 8
+BATCH_MAX_MS = 50
+
+# SSE framing, encoded once
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_DONE = b"data: [DONE]\n\n"
+
+
+def _sse(text: str) -> bytes:
+    return b"".join((_SSE_PREFIX, text.encode(), _SSE_SUFFIX))
+
+
+# Chat results are serialized directly into a Response, which bypasses
+# FastAPI's jsonable_encoder walk — orjson (C) when installed, stdlib otherwise
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def _json_response(result: dict) -> Response:
+        return Response(orjson.dumps(result, default=str, option=_ORJSON_OPTIONS), media_type="application/json")
+else:
+    def _json_response(result: dict) -> Response:
+        return Response(json.dumps(result, default=str).encode(), media_type="application/json")
+
 # ─── Initialize Agent ────────────────────────────────────────────────────────
 
 agent = MyAgent(
@@ -49,8 +81,24 @@ app = FastAPI(
 
 # ─── Auto-wire integration skills as routers ─────────────────────────────────
 
+# Routes added by the last _wire_integrations() call
+_integration_routes: list = []
+
+
 def _wire_integrations():
-    """Discover enabled integration skills and mount their FastAPI routers."""
+    """
+    Discover enabled integration skills and mount their FastAPI routers.
+
+    Safe to call again after a skill reload: the previous wiring's routes are
+    dropped from the route table in place, so nothing is registered twice.
+    """
+    routes = app.router.routes
+    if _integration_routes:
+        stale = set(map(id, _integration_routes))
+        routes[:] = [r for r in routes if id(r) not in stale]
+        _integration_routes.clear()
+    wired_from = len(routes)
+
     for skill in agent.skill_loader.get_integrations():
         if skill.module is None:
             continue
@@ -71,6 +119,9 @@ def _wire_integrations():
         else:
             logger.warning(f"Integration '{skill.name}' has no router factory")
 
+    _integration_routes.extend(routes[wired_from:])
+    app.openapi_schema = None   # regenerate /docs for the new route set
+
 _wire_integrations()
 
 # ─── API Models ───────────────────────────────────────────────────────────────
@@ -87,6 +138,28 @@ class ChatResponse(BaseModel):
     tool_calls: list = []
     metadata: dict = {}
 
+class _SSEResponse(Response):
+    """
+    Server-Sent Events written straight to the ASGI send channel.
+
+    Frames arrive pre-encoded, so unlike StreamingResponse there is no
+    per-chunk str→bytes step. A client disconnect still stops the frame
+    generator, and with it the model stream (see send_frames).
+    """
+
+    media_type = "text/event-stream"
+
+    def __init__(self, frames: AsyncIterator[bytes]):
+        # Response.__init__ is skipped on purpose — it would add Content-Length: 0
+        self.status_code = 200
+        self.background = None
+        self.init_headers({"cache-control": "no-cache"})
+        self._frames = frames
+
+    async def __call__(self, scope, receive, send):
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        await send_frames(self._frames, receive, send)
+
 # ─── Routes ───────────────────────────────────────────────────────────────────
 
 @app.get("/health")
@@ -113,19 +186,17 @@ async def chat(req: ChatRequest):
     Set stream=true in the request body for streaming.
     """
     if req.stream:
-        return StreamingResponse(
-            _stream_response(req),
-            media_type="text/event-stream",
-        )
+        return _SSEResponse(_stream_response(req))
 
-    return agent.handle_request({
+    # Awaited, not called — a blocking run here would stall every other request
+    return _json_response(await agent.ahandle_request({
         "input": req.input,
         "request_id": req.request_id,
         "session_id": req.session_id,
-    })
+    }))
 
 
-async def _stream_response(req: ChatRequest) -> AsyncIterator[str]:
+async def _stream_response(req: ChatRequest) -> AsyncIterator[bytes]:
     """Stream the agent response as Server-Sent Events.
 
     Guardrails (PII, injection) run automatically via Agno's pre_hooks.
@@ -139,26 +210,28 @@ async def _stream_response(req: ChatRequest) -> AsyncIterator[str]:
     try:
         input_text = agent.before_llm(req.input, {})
 
-        async for chunk in await agent.agno_agent.astream(
+        stream = await agent.agno_agent.astream(
             input_text,
             session_id=req.session_id,
-        ):
-            if chunk.content:
-                yield f"data: {chunk.content}\n\n"
+        )
 
-        yield "data: [DONE]\n\n"
+        # Tokens are coalesced into one frame per BATCH_MAX_TOKENS / BATCH_MAX_MS
+        async for text in batch_chunks(stream, BATCH_MAX_TOKENS, BATCH_MAX_MS):
+            yield _sse(text)
+        yield _SSE_DONE
 
     except InputCheckError as e:
-        yield f"data: {{\"error\": \"Request blocked: {e}\"}}\n\n"
+        yield _sse(f"{{\"error\": \"Request blocked: {e}\"}}")
     except Exception as e:
         logger.error(f"Streaming error: {e}")
-        yield f"data: {{\"error\": \"{e}\"}}\n\n"
+        yield _sse(f"{{\"error\": \"{e}\"}}")
 
 
 @app.post("/agent/reload-skills")
 async def reload_skills():
     """Hot-reload skills from the skills/ directory without restart."""
     agent.reload_skills()
+    _wire_integrations()
     return {
         "status": "reloaded",
         "skills": agent.get_skills_summary(),
@@ -41,9 +41,10 @@ setup(
         "postgres":   ["psycopg2-binary>=2.9"],
         "mysql":      ["pymysql>=1.1"],
         "metrics":    ["prometheus-client>=0.17"],
+        "orjson":     ["orjson>=3.9"],   # faster JSON log encoding
 
         # File parsing
-        "files":      ["PyPDF2>=3.0", "python-docx>=1.0", "pandas>=2.0", "openpyxl>=3.1"],
+        "files":      ["pypdf>=3.9", "python-docx>=1.0", "openpyxl>=3.1", "xlrd>=2.0"],
 
         # Everything
         "all": [
@@ -54,8 +55,8 @@ setup(
             "spider-client>=0.0.27", "firecrawl-py>=1.0",
             "slack_bolt>=1.18", "httpx>=0.24",
             "redis>=5.0", "psycopg2-binary>=2.9", "pymysql>=1.1",
-            "prometheus-client>=0.17",
-            "PyPDF2>=3.0", "python-docx>=1.0", "pandas>=2.0", "openpyxl>=3.1",
+            "prometheus-client>=0.17", "orjson>=3.9",
+            "pypdf>=3.9", "python-docx>=1.0", "openpyxl>=3.1", "xlrd>=2.0",
         ],
     },
 )
@@ -0,0 +1,89 @@
+"""
+Unit tests for the shared toolkit caches.
+"""
+
+import pytest
+from agno_single_agent_framework.tools import _cache
+from agno_single_agent_framework.tools._cache import TTLCache, SQLiteCache
+
+
+class FakeClock:
+    """Stands in for the time module inside _cache."""
+
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(_cache, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path, clock):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), maxsize=3, ttl=10)
+    yield cache
+    cache.close()
+
+
+class TestTTLCache:
+    def test_entry_expires_after_ttl(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("k", "v")
+        clock.now += 9
+        assert cache.get("k") == "v"
+        clock.now += 2
+        assert cache.get("k") is None
+
+    def test_evicts_least_recently_used(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+
+class TestSQLiteCache:
+    def test_round_trips_json_values(self, sqlite_cache):
+        sqlite_cache.set(b"k", {"output": "hi", "tokens": [1, 2]})
+        assert sqlite_cache.get(b"k") == {"output": "hi", "tokens": [1, 2]}
+
+    def test_entry_expires_after_ttl(self, sqlite_cache, clock):
+        sqlite_cache.set(b"k", "v")
+        clock.now += 11
+        assert sqlite_cache.get(b"k") is None
+
+    def test_size_eviction_keeps_newest_within_one_second(self, sqlite_cache, clock, monkeypatch):
+        monkeypatch.setattr(sqlite_cache, "_EVICT_EVERY", 1)
+        for i in range(5):
+            clock.now += 0.1   # all five writes land in the same second
+            sqlite_cache.set(bytes([i]), i)
+        assert [sqlite_cache.get(bytes([i])) for i in range(5)] == [None, None, 2, 3, 4]
+
+    def test_eviction_purges_expired_rows(self, sqlite_cache, clock, monkeypatch):
+        sqlite_cache.set(b"old", "v")
+        clock.now += 11
+        monkeypatch.setattr(sqlite_cache, "_EVICT_EVERY", 1)
+        sqlite_cache.set(b"new", "v")
+        (count,) = sqlite_cache._conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+        assert count == 1
+
+    def test_persists_across_instances(self, tmp_path, clock):
+        path = str(tmp_path / "cache.db")
+        first = SQLiteCache(path, maxsize=3, ttl=10)
+        first.set(b"k", "v")
+        first.close()
+        second = SQLiteCache(path, maxsize=3, ttl=10)
+        assert second.get(b"k") == "v"
+        second.close()
@@ -0,0 +1,118 @@
+"""
+Unit tests for the database lookup toolkit (no database server needed).
+"""
+
+import inspect
+import threading
+
+import pytest
+
+pytest.importorskip("agno.tools")
+
+from agno_single_agent_framework.tools.database_lookup import _POOL_MAX, _BlockingPool, DatabaseLookupToolkit
+
+
+class _LimitedPool:
+    """Stands in for ThreadedConnectionPool: raises once maxconn connections are out."""
+
+    def __init__(self, maxconn):
+        self.maxconn = maxconn
+        self.out = 0
+        self.lock = threading.Lock()
+
+    def getconn(self):
+        with self.lock:
+            if self.out >= self.maxconn:
+                raise RuntimeError("connection pool exhausted")
+            self.out += 1
+            return object()
+
+    def putconn(self, conn, close=False):
+        with self.lock:
+            self.out -= 1
+
+
+class TestBlockingPool:
+    def test_extra_caller_waits_instead_of_raising(self):
+        pool = _BlockingPool(_LimitedPool(_POOL_MAX), _POOL_MAX)
+        conns = []
+        workers = [threading.Thread(target=lambda: conns.append(pool.getconn())) for _ in range(_POOL_MAX)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert len(conns) == _POOL_MAX
+
+        got, errors = threading.Event(), []
+
+        def extra():
+            try:
+                conns.append(pool.getconn())
+                got.set()
+            except Exception as e:   # the unwrapped pool would raise here
+                errors.append(e)
+
+        waiter = threading.Thread(target=extra)
+        waiter.start()
+        assert not got.wait(0.2)
+        assert not errors
+
+        pool.putconn(conns.pop(0))
+        assert got.wait(2)
+        waiter.join()
+        assert not errors
+
+
+@pytest.fixture
+def toolkit_calls(monkeypatch):
+    """A toolkit whose query backend is replaced by a recorder; returns (factory, calls)."""
+    monkeypatch.delenv("DATABASE_MAX_ROWS", raising=False)
+    calls = []
+
+    def make(**kwargs):
+        toolkit = DatabaseLookupToolkit(database_url="postgresql://localhost/test", **kwargs)
+
+        def querier(sql, max_rows, params):
+            calls.append(max_rows)
+            return {"rows": [{"id": 1, "tags": ["a"]}], "row_count": 1, "columns": ["id", "tags"]}
+
+        toolkit._querier = querier
+        return toolkit
+
+    return make, calls
+
+
+class TestQueryCache:
+    def test_mutating_a_result_does_not_touch_the_cache(self, toolkit_calls):
+        make, calls = toolkit_calls
+        toolkit = make()
+        first = toolkit.query("SELECT * FROM t")
+        first["rows"][0]["tags"].append("mutated")
+        first["rows"].clear()
+
+        hit = toolkit.query("SELECT * FROM t")
+        assert len(calls) == 1
+        assert hit["rows"] == [{"id": 1, "tags": ["a"]}]
+
+        hit["rows"][0]["id"] = 2
+        assert toolkit.query("SELECT * FROM t")["rows"] == [{"id": 1, "tags": ["a"]}]
+
+
+class TestMaxRows:
+    def test_not_part_of_the_tool_schema(self, toolkit_calls):
+        make, _ = toolkit_calls
+        toolkit = make()
+        assert "max_rows" not in inspect.signature(toolkit.query).parameters
+
+    def test_constructor_setting(self, toolkit_calls):
+        make, calls = toolkit_calls
+        make(max_rows=5).query("SELECT 1")
+        assert calls == [5]
+
+    def test_env_setting(self, toolkit_calls, monkeypatch):
+        make, calls = toolkit_calls
+        monkeypatch.setenv("DATABASE_MAX_ROWS", "20")
+        make().query("SELECT 1")
+        monkeypatch.setenv("DATABASE_MAX_ROWS", "lots")
+        make().query("SELECT 1")
+        assert calls == [20, None]
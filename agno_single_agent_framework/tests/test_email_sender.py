@@ -0,0 +1,113 @@
+"""
+Unit tests for the email sender toolkit, against a fake smtplib.SMTP.
+"""
+
+import smtplib
+
+import pytest
+
+pytest.importorskip("agno.tools")
+
+from agno_single_agent_framework.tools import email_sender
+from agno_single_agent_framework.tools.email_sender import EmailSenderToolkit
+
+
+class FakeSMTP:
+    """Records every session; class-level queues script connect and send failures."""
+
+    sessions = []
+    connect_errors = []
+    send_errors = {}   # recipient -> exception raised once
+
+    def __init__(self, host, port):
+        if FakeSMTP.connect_errors:
+            raise FakeSMTP.connect_errors.pop(0)
+        self.sent = []
+        self.closed = False
+        FakeSMTP.sessions.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        if password == "wrong":
+            raise smtplib.SMTPAuthenticationError(535, b"bad credentials")
+
+    def send_message(self, msg):
+        error = FakeSMTP.send_errors.pop(msg["To"], None)
+        if error is not None:
+            raise error
+        self.sent.append(msg["To"])
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_smtp(monkeypatch):
+    FakeSMTP.sessions = []
+    FakeSMTP.connect_errors = []
+    FakeSMTP.send_errors = {}
+    monkeypatch.setattr(email_sender.smtplib, "SMTP", FakeSMTP)
+    return FakeSMTP
+
+
+def _toolkit(password="secret"):
+    return EmailSenderToolkit(
+        smtp_host="smtp.test", smtp_port=587, smtp_user="bot@test", smtp_password=password,
+    )
+
+
+RECIPIENTS = ["a@test", "b@test", "c@test"]
+
+
+class TestSendBulk:
+    def test_one_session_for_every_recipient(self, fake_smtp):
+        result = _toolkit().send_bulk(RECIPIENTS, "hi", "body")
+        assert result == {"sent": 3, "failed": []}
+        assert len(fake_smtp.sessions) == 1
+        assert fake_smtp.sessions[0].sent == RECIPIENTS
+
+    def test_refused_recipient_reported_others_sent(self, fake_smtp):
+        fake_smtp.send_errors["b@test"] = smtplib.SMTPRecipientsRefused({"b@test": (550, b"no such user")})
+        result = _toolkit().send_bulk(RECIPIENTS, "hi", "body")
+        assert result["sent"] == 2
+        assert [f["to"] for f in result["failed"]] == ["b@test"]
+        assert fake_smtp.sessions[0].sent == ["a@test", "c@test"]
+
+    def test_dropped_session_reconnects_once(self, fake_smtp):
+        fake_smtp.send_errors["b@test"] = smtplib.SMTPServerDisconnected("gone")
+        result = _toolkit().send_bulk(RECIPIENTS, "hi", "body")
+        assert result == {"sent": 3, "failed": []}
+        assert len(fake_smtp.sessions) == 2
+        assert fake_smtp.sessions[0].closed
+        assert fake_smtp.sessions[1].sent == ["b@test", "c@test"]
+
+    def test_failed_connect_retried_once(self, fake_smtp):
+        fake_smtp.connect_errors = [smtplib.SMTPConnectError(421, b"busy")]
+        assert _toolkit().send_bulk(RECIPIENTS, "hi", "body") == {"sent": 3, "failed": []}
+
+    def test_refused_connection_retried_once(self, fake_smtp):
+        fake_smtp.connect_errors = [ConnectionRefusedError("refused")]
+        assert _toolkit().send_bulk(RECIPIENTS, "hi", "body") == {"sent": 3, "failed": []}
+
+    def test_second_connect_failure_reported(self, fake_smtp):
+        fake_smtp.connect_errors = [smtplib.SMTPConnectError(421, b"busy")] * 2
+        result = _toolkit().send_bulk(["a@test"], "hi", "body")
+        assert result["sent"] == 0
+        assert result["failed"][0]["to"] == "a@test"
+
+    def test_auth_error_not_retried(self, fake_smtp):
+        result = _toolkit(password="wrong").send_bulk(["a@test"], "hi", "body")
+        assert result["sent"] == 0
+        assert len(fake_smtp.sessions) == 1
+        assert fake_smtp.sessions[0].closed
+
+    def test_not_configured(self, fake_smtp, monkeypatch):
+        monkeypatch.delenv("SMTP_HOST", raising=False)
+        toolkit = EmailSenderToolkit(smtp_user="bot@test", smtp_password="secret")
+        assert "error" in toolkit.send_bulk(RECIPIENTS, "hi", "body")
+        assert fake_smtp.sessions == []
@@ -0,0 +1,58 @@
+"""
+Unit tests for the file parser's CSV reading.
+"""
+
+import csv
+import io
+
+import pytest
+
+pytest.importorskip("agno.tools")
+
+from agno_single_agent_framework.tools.file_parser import _read_csv, _row_dict
+
+CSV_TEXT = (
+    "name,age,city\n"
+    "ann,31,paris\n"          # exact
+    "bob,42\n"                # short
+    "cid\n"                   # one field
+    "dee,27,rome,x,y\n"       # long
+    "\n"                      # blank line
+    '"eve, jr",19,"oslo\nnorth"\n'
+)
+
+
+def _dict_reader_rows(text):
+    return list(csv.DictReader(io.StringIO(text, newline="")))
+
+
+class TestRowDict:
+    @pytest.mark.parametrize("row", [
+        ["ann", "31", "paris"],
+        ["bob", "42"],
+        ["cid"],
+        ["dee", "27", "rome", "x", "y"],
+    ])
+    def test_matches_dict_reader(self, row):
+        reader = csv.DictReader(iter(["name,age,city", ",".join(row)]))
+        assert _row_dict(["name", "age", "city"], row) == next(reader)
+
+    def test_duplicate_columns_last_wins(self):
+        reader = csv.DictReader(iter(["a,a,b", "1,2,3"]))
+        assert _row_dict(["a", "a", "b"], ["1", "2", "3"]) == next(reader)
+
+
+class TestReadCsv:
+    def test_rows_match_dict_reader(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text(CSV_TEXT, encoding="utf-8", newline="")
+        result = _read_csv(str(path), max_rows=50)
+        assert result["rows"] == _dict_reader_rows(CSV_TEXT)
+        assert result["row_count"] == 5
+
+    def test_max_rows_counts_the_rest(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text(CSV_TEXT, encoding="utf-8", newline="")
+        result = _read_csv(str(path), max_rows=2)
+        assert result["rows"] == _dict_reader_rows(CSV_TEXT)[:2]
+        assert result["row_count"] == 5
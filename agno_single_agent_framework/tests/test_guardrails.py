@@ -0,0 +1,85 @@
+"""
+Unit tests for the PII pre-screen: it may only clear text that none of
+the individual patterns would flag.
+"""
+
+import random
+import re
+
+import pytest
+
+from agno_single_agent_framework.services.guardrails import _combine
+
+# Same expressions and flags as agno.guardrails.PIIDetectionGuardrail (used when agno is absent)
+AGNO_PII_PATTERNS = {
+    "SSN": re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
+    "Credit Card": re.compile(r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b"),
+    "Email": re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"),
+    "Phone": re.compile(r"\b\d{3}[\s.-]?\d{3}[\s.-]?\d{4}\b"),
+}
+
+SAMPLES = {
+    "SSN": ["123-45-6789", "١٢٣-٤٥-٦٧٨٩", "１２３-４５-６７８９", "ssn १२३-४५-६७८९ ok"],
+    "Credit Card": ["4111 1111 1111 1111", "4111-1111-1111-1111", "٤١١١٤١١١٤١١١٤١١١", "card ４１１１ ４１１１ ４１１１ ４１１１"],
+    "Email": ["jane.doe@example.com", "mail me: a_b+c@mail.example.org"],
+    "Phone": ["555-123-4567", "555.123.4567", "(call) 5551234567", "٥٥٥ ١٢٣ ٤٥٦٧"],
+}
+
+CLEAN = ["What is the weather in Paris?", "Order 12-34 shipped", "price: 1,299.00", "v1.2.3 release", "ünïcode@exämple.de", ""]
+
+
+def _patterns():
+    patterns = dict(AGNO_PII_PATTERNS)
+    try:
+        from agno.guardrails import PIIDetectionGuardrail
+    except ImportError:
+        return patterns
+    return dict(PIIDetectionGuardrail().pii_patterns)   # the real ones when agno is installed
+
+
+def _flags_any(patterns, text):
+    return any(p.search(text) for p in patterns)
+
+
+@pytest.fixture(scope="module")
+def patterns():
+    return list(_patterns().values())
+
+
+@pytest.fixture(scope="module")
+def prescreen(patterns):
+    combined = _combine(patterns)
+    assert combined is not None
+    return combined
+
+
+class TestPrescreen:
+    @pytest.mark.parametrize("name", sorted(SAMPLES))
+    def test_each_pattern_is_caught(self, name, prescreen):
+        own = _patterns().get(name)
+        if own is None:
+            pytest.skip(f"agno has no {name!r} pattern")
+        for text in SAMPLES[name]:
+            assert own.search(text), text
+            assert prescreen.search(text), text
+
+    def test_clean_text_passes(self, patterns, prescreen):
+        for text in CLEAN:
+            assert not _flags_any(patterns, text)
+            assert prescreen.search(text) is None
+
+    def test_agrees_with_the_patterns_on_random_text(self, patterns, prescreen):
+        digits = "0123456789" + "٠١٢٣٤٥٦٧٨٩" + "０１２３４５６７８９" + "०१२३४५६७८९"
+        alphabet = digits * 3 + " -.@_+%|()ÄéxyZ  "
+        rng = random.Random(1234)
+        for _ in range(5000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+            assert (prescreen.search(text) is not None) == _flags_any(patterns, text), repr(text)
+
+
+class TestCombine:
+    def test_differing_flags_not_combined(self):
+        assert _combine([re.compile("a"), re.compile("b", re.IGNORECASE)]) is None
+
+    def test_clashing_group_names_not_combined(self):
+        assert _combine([re.compile(r"(?P<n>\d)"), re.compile(r"(?P<n>x)")]) is None
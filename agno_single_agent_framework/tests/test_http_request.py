@@ -0,0 +1,120 @@
+"""
+Unit tests for the HTTP request toolkit (no network needed).
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("agno.tools")
+pytest.importorskip("requests")
+
+from agno_single_agent_framework.tools.http_request import _BODY_CHUNK, _TEXT_BODY_CAP, HTTPRequestToolkit
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=b"", headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.encoding = "utf-8"
+        self.body = body
+        self.chunks_read = 0
+        self.closed = False
+
+    def iter_content(self, size):
+        for start in range(0, len(self.body), size):
+            self.chunks_read += 1
+            yield self.body[start:start + size]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    """Replays queued responses and records the headers of each request."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def request(self, method, url, headers, json, timeout, stream):
+        self.sent_headers.append(dict(headers))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def toolkit():
+    toolkit = HTTPRequestToolkit()
+    toolkit.close()
+    return toolkit
+
+
+def _json_response(payload, **headers):
+    return FakeResponse(200, json.dumps(payload).encode(), {"Content-Type": "application/json", **headers})
+
+
+class TestRevalidation:
+    def test_304_serves_the_cached_result(self, toolkit):
+        toolkit._session = FakeSession(
+            _json_response({"items": [1, 2]}, ETag='"v1"'),
+            FakeResponse(304, headers={"ETag": '"v1"'}),
+        )
+        first = toolkit.get("https://api.test/items")
+        second = toolkit.get("https://api.test/items")
+
+        assert toolkit._session.sent_headers == [{}, {"If-None-Match": '"v1"'}]
+        assert second == first
+        assert second["body"] == {"items": [1, 2]}
+
+    def test_last_modified_sent_back(self, toolkit):
+        stamp = "Wed, 21 Oct 2026 07:28:00 GMT"
+        toolkit._session = FakeSession(
+            _json_response({}, **{"Last-Modified": stamp}),
+            FakeResponse(304),
+        )
+        toolkit.get("https://api.test/items")
+        toolkit.get("https://api.test/items")
+        assert toolkit._session.sent_headers[1] == {"If-Modified-Since": stamp}
+
+    def test_caller_headers_win(self, toolkit):
+        toolkit._session = FakeSession(
+            _json_response({}, ETag='"v1"'),
+            FakeResponse(304),
+        )
+        toolkit.get("https://api.test/items", headers={"If-None-Match": '"mine"'})
+        toolkit.get("https://api.test/items", headers={"If-None-Match": '"mine"'})
+        assert toolkit._session.sent_headers[1] == {"If-None-Match": '"mine"'}
+
+    def test_mutating_a_304_result_does_not_touch_the_cache(self, toolkit):
+        toolkit._session = FakeSession(
+            _json_response({"items": [1, 2]}, ETag='"v1"'),
+            FakeResponse(304),
+            FakeResponse(304),
+        )
+        toolkit.get("https://api.test/items")
+        toolkit.get("https://api.test/items")["body"]["items"].append(3)
+        assert toolkit.get("https://api.test/items")["body"] == {"items": [1, 2]}
+
+    def test_no_validators_no_conditional_request(self, toolkit):
+        toolkit._session = FakeSession(_json_response({}), _json_response({}))
+        toolkit.get("https://api.test/items")
+        toolkit.get("https://api.test/items")
+        assert toolkit._session.sent_headers == [{}, {}]
+
+
+class TestBodyCap:
+    def test_text_body_read_stops_at_the_cap(self, toolkit):
+        resp = FakeResponse(200, b"x" * (_TEXT_BODY_CAP * 10), {"Content-Type": "text/plain"})
+        toolkit._session = FakeSession(resp)
+        result = toolkit.get("https://api.test/big")
+
+        assert resp.chunks_read == -(-_TEXT_BODY_CAP // _BODY_CHUNK)
+        assert resp.closed
+        assert result["body"] == "x" * 2000
+
+    def test_json_body_read_whole(self, toolkit):
+        payload = {"data": "y" * (_TEXT_BODY_CAP * 2)}
+        resp = _json_response(payload)
+        toolkit._session = FakeSession(resp)
+        assert toolkit.get("https://api.test/big")["body"] == payload
+        assert resp.closed
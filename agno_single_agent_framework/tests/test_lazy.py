@@ -0,0 +1,19 @@
+"""
+Unit tests for the lazy package exports.
+"""
+
+import pytest
+
+import agno_single_agent_framework.core as core
+
+
+class TestLazyExports:
+    def test_name_resolves_and_is_cached(self):
+        from agno_single_agent_framework.core.memory import MemoryManager
+
+        assert core.MemoryManager is MemoryManager
+        assert core.__dict__["MemoryManager"] is MemoryManager
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+            core.missing
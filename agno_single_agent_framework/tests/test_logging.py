@@ -0,0 +1,65 @@
+"""
+Unit tests for the queued logging setup.
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("agno.utils.log")
+
+from agno_single_agent_framework.services import logging as agent_logging
+
+
+@pytest.fixture(autouse=True)
+def fresh_listeners():
+    agent_logging._stop_listeners()
+    yield
+    agent_logging._stop_listeners()
+
+
+def _running(listener):
+    return listener._thread is not None and listener._thread.is_alive()
+
+
+class TestSetupLogging:
+    def test_repeat_setup_keeps_one_handler_and_listener(self):
+        logger = agent_logging.setup_logging("test-agent")
+        agent_logging.setup_logging("test-agent")
+
+        assert len(logger.handlers) == 1
+        assert len(agent_logging._listeners) == 1
+        (listener, queue_handler), = agent_logging._listeners.values()
+        assert _running(listener)
+        assert logger.handlers[0] is queue_handler
+
+    def test_agents_with_same_config_share_a_listener(self):
+        first = agent_logging.setup_logging("agent-a")
+        second = agent_logging.setup_logging("agent-b")
+        assert len(agent_logging._listeners) == 1
+        assert first.handlers == second.handlers
+
+    def test_config_change_stops_the_unused_listener(self):
+        agent_logging.setup_logging("agent-a")
+        (old, _), = agent_logging._listeners.values()
+        agent_logging.setup_logging("agent-a", log_format="json")
+
+        assert len(agent_logging._listeners) == 1
+        assert not _running(old)
+
+    def test_listener_kept_while_another_agent_uses_it(self):
+        agent_logging.setup_logging("agent-a")
+        agent_logging.setup_logging("agent-b")
+        (shared, _), = agent_logging._listeners.values()
+        agent_logging.setup_logging("agent-a", log_format="json")
+
+        assert len(agent_logging._listeners) == 2
+        assert _running(shared)
+
+    def test_records_reach_the_handlers(self, tmp_path):
+        log_file = tmp_path / "agent.log"
+        logger = agent_logging.setup_logging("agent-file", log_file=str(log_file))
+        logger.warning("hello %s", "file")
+        agent_logging._stop_listeners()   # flushes the queue
+        messages = [json.loads(line)["message"] for line in log_file.read_text().splitlines()]
+        assert messages[-1] == "hello file"
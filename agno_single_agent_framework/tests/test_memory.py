@@ -0,0 +1,48 @@
+"""
+Unit tests for session memory recall.
+"""
+
+from agno_single_agent_framework.core.memory import MemoryManager, select_relevant
+
+
+def _memory(*texts):
+    memory = MemoryManager()
+    for text in texts:
+        memory.save("s", {"user": text, "assistant": "ok"})
+    return memory
+
+
+def _users(entries):
+    return [entry["user"] for entry in entries]
+
+
+class TestRecall:
+    def test_short_history_returned_whole(self):
+        memory = _memory("a", "b", "c")
+        assert _users(memory.recall("s", "anything", k=2, recent=1)) == ["a", "b", "c"]
+
+    def test_keeps_recent_and_most_relevant_in_order(self):
+        memory = _memory("paris weather", "apple stock", "paris trains", "dogs", "cats", "fish")
+        picked = memory.recall("s", "trip to Paris", k=2, recent=2)
+        assert _users(picked) == ["paris weather", "paris trains", "cats", "fish"]
+
+    def test_ties_go_to_newer_entries(self):
+        memory = _memory("one", "two", "three", "four", "latest")
+        assert _users(memory.recall("s", "unrelated", k=2, recent=1)) == ["three", "four", "latest"]
+
+    def test_no_recent_window(self):
+        memory = _memory("red apple", "green pear", "red cherry", "blue sky")
+        assert _users(memory.recall("s", "red", k=2, recent=0)) == ["red apple", "red cherry"]
+
+    def test_unknown_session(self):
+        assert MemoryManager().recall("missing", "query") == []
+
+
+class TestSelectRelevant:
+    def test_short_history_returned_unchanged(self):
+        history = [{"user": "a"}, {"user": "b"}]
+        assert select_relevant(history, "anything", k=2, recent=1) is history
+
+    def test_works_on_prefetched_history(self):
+        history = [{"user": text} for text in ("paris weather", "apple stock", "dogs", "cats", "fish")]
+        assert _users(select_relevant(history, "paris", k=1, recent=2)) == ["paris weather", "cats", "fish"]
@@ -0,0 +1,127 @@
+"""
+Unit tests for SSE token batching and the raw ASGI frame sender.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from agno_single_agent_framework.core.streaming import batch_chunks, send_frames
+
+
+async def _chunks(items):
+    """Yield chunks; a float item is a pause in seconds instead of a token."""
+    for item in items:
+        if isinstance(item, float):
+            await asyncio.sleep(item)
+        else:
+            yield SimpleNamespace(content=item)
+
+
+async def _collect(items, max_tokens, max_ms):
+    return [batch async for batch in batch_chunks(_chunks(items), max_tokens, max_ms)]
+
+
+class TestBatchChunks:
+    def test_flushes_on_token_count(self):
+        batches = asyncio.run(_collect(["x"] * 20, max_tokens=8, max_ms=10_000))
+        assert batches == ["x" * 8, "x" * 8, "x" * 4]
+
+    def test_flushes_on_deadline_while_model_is_quiet(self):
+        batches = asyncio.run(_collect(["a", "b", 0.3, "c"], max_tokens=8, max_ms=50))
+        assert batches == ["ab", "c"]
+
+    def test_skips_empty_chunks(self):
+        batches = asyncio.run(_collect(["", "a", None, "b"], max_tokens=2, max_ms=10_000))
+        assert batches == ["ab"]
+
+    def test_empty_stream(self):
+        assert asyncio.run(_collect([], max_tokens=8, max_ms=50)) == []
+
+    def test_closing_cancels_the_pending_read(self):
+        cancelled = asyncio.Event()
+
+        async def stalled():
+            yield SimpleNamespace(content="a")
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            yield SimpleNamespace(content="never")
+
+        async def run():
+            batches = batch_chunks(stalled(), max_tokens=8, max_ms=20)
+            assert await batches.__anext__() == "a"   # flushed by the deadline
+            await batches.aclose()
+            await asyncio.wait_for(cancelled.wait(), 1)
+
+        asyncio.run(run())
+
+
+async def _never():
+    await asyncio.Event().wait()
+
+
+class TestSendFrames:
+    def test_sends_every_frame_then_ends_the_body(self):
+        sent = []
+
+        async def frames():
+            yield b"data: a\n\n"
+            yield b"data: b\n\n"
+
+        async def send(message):
+            sent.append(message)
+
+        async def receive():
+            await _never()
+
+        asyncio.run(send_frames(frames(), receive, send))
+        assert [m["body"] for m in sent] == [b"data: a\n\n", b"data: b\n\n", b""]
+        assert [m["more_body"] for m in sent] == [True, True, False]
+
+    def test_disconnect_stops_the_frame_generator(self):
+        sent = []
+        closed = []
+        first_sent = None
+
+        async def frames():
+            try:
+                yield b"data: a\n\n"
+                await asyncio.sleep(60)   # model still generating
+                yield b"data: never\n\n"
+            finally:
+                closed.append(True)
+
+        async def send(message):
+            sent.append(message)
+            first_sent.set()
+
+        async def receive():
+            await first_sent.wait()
+            return {"type": "http.disconnect"}
+
+        async def run():
+            nonlocal first_sent
+            first_sent = asyncio.Event()
+            await asyncio.wait_for(send_frames(frames(), receive, send), 1)
+
+        asyncio.run(run())
+        assert closed == [True]
+        assert [m["body"] for m in sent] == [b"data: a\n\n"]
+
+    def test_generator_errors_propagate(self):
+        async def frames():
+            raise RuntimeError("boom")
+            yield b""
+
+        async def send(message):
+            pass
+
+        async def receive():
+            await _never()
+
+        with pytest.raises(RuntimeError, match="boom"):
+            asyncio.run(send_frames(frames(), receive, send))
@@ -0,0 +1,66 @@
+"""
+Unit tests for the web search result cache (no network needed).
+"""
+
+import pytest
+
+pytest.importorskip("agno.tools")
+pytest.importorskip("requests")
+
+from agno_single_agent_framework.tools import web_search
+from agno_single_agent_framework.tools.web_search import WebSearchToolkit, _cache_ttl_from_env
+
+
+@pytest.fixture
+def toolkit(monkeypatch):
+    """A toolkit whose provider call is counted; the shared cache starts empty."""
+    monkeypatch.setenv("TAVILY_API_KEY", "test-key")
+    monkeypatch.setattr(web_search, "_SEARCH_CACHE_TTL", 300.0)
+    web_search._SEARCH_CACHE.clear()
+    toolkit = WebSearchToolkit()
+    toolkit.calls = 0
+
+    def fake_search(provider, query, num_results, api_key):
+        toolkit.calls += 1
+        return {"provider": provider, "query": query, "results": [{"title": "first", "url": "https://a.test"}]}
+
+    toolkit._search = fake_search
+    yield toolkit
+    web_search._SEARCH_CACHE.clear()
+
+
+class TestSearchCache:
+    def test_repeat_query_served_from_cache(self, toolkit):
+        assert toolkit.search("agno") == toolkit.search("agno")
+        assert toolkit.calls == 1
+
+    def test_mutating_a_result_does_not_touch_the_cache(self, toolkit):
+        first = toolkit.search("agno")
+        first["results"][0]["title"] = "changed"
+        first["results"].append({})
+
+        hit = toolkit.search("agno")
+        hit["results"].clear()
+
+        assert toolkit.search("agno")["results"] == [{"title": "first", "url": "https://a.test"}]
+        assert toolkit.calls == 1
+
+    def test_errors_are_not_cached(self, toolkit):
+        toolkit._search = lambda *args: {"error": "rate limited"}
+        toolkit.search("agno")
+        assert web_search._SEARCH_CACHE.get(("tavily", "agno", 5)) is None
+
+
+class TestCacheTTLFromEnv:
+    def test_unset_uses_default(self, monkeypatch):
+        monkeypatch.delenv("WEB_SEARCH_CACHE_TTL", raising=False)
+        assert _cache_ttl_from_env(default=300.0) == 300.0
+
+    def test_numeric_value(self, monkeypatch):
+        monkeypatch.setenv("WEB_SEARCH_CACHE_TTL", "0")
+        assert _cache_ttl_from_env(default=300.0) == 0.0
+
+    def test_malformed_value_falls_back(self, monkeypatch, caplog):
+        monkeypatch.setenv("WEB_SEARCH_CACHE_TTL", "5min")
+        assert _cache_ttl_from_env(default=300.0) == 300.0
+        assert "WEB_SEARCH_CACHE_TTL" in caplog.text